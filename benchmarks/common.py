@@ -0,0 +1,22 @@
+import os
+import time
+
+os.environ.setdefault('MONSTRO_SETTINGS', 'monstro.conf.default.Settings')
+
+import tornado.ioloop  # pylint: disable=C0413
+
+
+def run(function, *args, **kwargs):
+    return tornado.ioloop.IOLoop.current().run_sync(
+        lambda: function(*args, **kwargs)
+    )
+
+
+def measure(name, function, number, *args, **kwargs):
+    start = time.perf_counter()
+    run(function, number, *args, **kwargs)
+    elapsed = time.perf_counter() - start
+
+    print('{:<40} {:>10.2f} us/op'.format(name, elapsed / number * 1e6))
+
+    return elapsed
@@ -0,0 +1,219 @@
+import tracemalloc
+
+import bson
+
+import common
+
+from monstro import db
+
+
+NUMBER = 1000000
+SAMPLE = 100000
+
+
+class Benchmark(db.Model):
+
+    name = db.String()
+    age = db.Integer()
+    email = db.String()
+
+    class Meta:
+        collection = 'benchmark'
+
+
+class SlottedBenchmark(db.Model):
+
+    __slots__ = ()
+
+    name = db.String()
+    age = db.Integer()
+    email = db.String()
+
+    class Meta:
+        collection = 'benchmark'
+
+
+class Legacy(object):
+
+    class Meta:
+        fields = Benchmark.Meta.fields
+
+    def __new__(cls, *args, **kwargs):
+        self = object.__new__(cls)
+        self.Meta = cls.Meta()
+        return self
+
+    def __init__(self, **kwargs):
+        self.Meta.data = kwargs
+
+    def __getattr__(self, attribute):
+        if attribute in self.Meta.fields:
+            try:
+                return self.Meta.data[attribute]
+            except KeyError:
+                value = self.Meta.fields[attribute].default
+                self.Meta.data[attribute] = value
+                return value
+
+        raise AttributeError(attribute)
+
+
+class LegacyPipeline(object):
+
+    @staticmethod
+    async def on_save(field, value):
+        return value
+
+    @staticmethod
+    async def on_create(field, value):
+        return value
+
+    @staticmethod
+    async def deserialize(field, value):
+        return field.to_python(value)
+
+    @staticmethod
+    async def serialize(field, value):
+        return field.to_primitive(value)
+
+    @classmethod
+    async def validate(cls, field, value):
+        if value is None:
+            value = field.default
+
+        if value is None:
+            if field.required:
+                field.fail('required')
+
+            return None
+
+        value = await cls.deserialize(field, value)
+
+        for validator in field.validators:
+            value = await validator(value)
+
+        return value
+
+    @classmethod
+    async def dump(cls, instance):
+        fields = instance.Meta.fields
+
+        if not instance._id:
+            for name, field in fields.items():
+                value = instance.get_value(name)
+                instance.set_value(name, await cls.on_create(field, value))
+
+        for name, field in fields.items():
+            value = instance.get_value(name)
+            instance.set_value(name, await cls.on_save(field, value))
+
+        for name, field in fields.items():
+            value = instance.get_value(name)
+
+            if field.read_only and name != '_id':
+                value = field.default
+
+            try:
+                value = await cls.validate(field, value)
+            except db.ValidationError as e:
+                raise db.ValidationError({name: e.error})
+
+            instance.set_value(name, value)
+
+        data = {}
+
+        for name, field in fields.items():
+            value = instance.get_value(name)
+
+            if value is not None:
+                data[name] = await cls.serialize(field, value)
+
+        data.pop('_id', None)
+
+        return data
+
+    @classmethod
+    async def load(cls, model, data):
+        for name, field in model.Meta.fields.items():
+            value = data.get(name)
+
+            if value is None:
+                data[name] = value
+            else:
+                try:
+                    data[name] = await cls.deserialize(field, value)
+                except db.ValidationError:
+                    data[name] = None
+
+        return model(**data)
+
+
+def memory(name, model):
+    tracemalloc.start()
+    instances = [
+        model(_id=index, name='name', age=index, email='email')
+        for index in range(SAMPLE)
+    ]
+    size, __ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print('{:<40} {:>10.2f} MB/1M'.format(
+        name, size * NUMBER / len(instances) / 2 ** 20
+    ))
+
+
+async def access(number, model):
+    instance = model(_id=1, name='name', age=1, email='email')
+
+    for __ in range(number):
+        instance.name  # pylint: disable=W0104
+        instance.age  # pylint: disable=W0104
+
+
+async def construct(number, model):
+    for index in range(number):
+        model(_id=index, name='name', age=index, email='email')
+
+
+async def dump(number, fused=True):
+    instance = Benchmark(name='name', age=1, email='email')
+
+    for __ in range(number):
+        if fused:
+            await instance.pre_save()
+        else:
+            await LegacyPipeline.dump(instance)
+
+
+async def load(number, fused=True):
+    document = {
+        '_id': bson.ObjectId(), 'name': 'name', 'age': 1, 'email': 'email'
+    }
+
+    for __ in range(number):
+        if fused:
+            await Benchmark.from_db(dict(document))
+        else:
+            await LegacyPipeline.load(Benchmark, dict(document))
+
+
+def main():
+    memory('Model memory (legacy layout)', Legacy)
+    memory('Model memory (descriptors)', Benchmark)
+    memory('Model memory (descriptors, no __dict__)', SlottedBenchmark)
+    common.measure('Model attribute access (legacy layout)', access, NUMBER,
+                   Legacy)
+    common.measure('Model attribute access (descriptors)', access, NUMBER,
+                   Benchmark)
+    common.measure('Model construction (legacy layout)', construct, NUMBER,
+                   Legacy)
+    common.measure('Model construction (descriptors)', construct, NUMBER,
+                   Benchmark)
+    common.measure('Model save passes (legacy)', dump, SAMPLE, False)
+    common.measure('Model save passes (codec)', dump, SAMPLE)
+    common.measure('Model load (legacy)', load, SAMPLE, False)
+    common.measure('Model load (codec)', load, SAMPLE)
+
+
+if __name__ == '__main__':
+    main()
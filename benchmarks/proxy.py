@@ -0,0 +1,41 @@
+import common
+
+from monstro import db
+
+
+NUMBER = 100000
+WRITES = 10000
+
+
+class Benchmark(db.Model):
+
+    name = db.String()
+
+    class Meta:
+        collection = 'benchmark'
+
+
+async def find(number, collection):
+    for __ in range(number):
+        collection.find({'name': 'name'}, limit=10)
+
+
+async def insert(number, collection):
+    for __ in range(number):
+        await collection.insert_one({'name': 'name'})
+
+
+def main():
+    proxy = Benchmark.Meta.collection
+    collection = proxy.instance
+
+    common.measure('find (motor)', find, NUMBER, collection)
+    common.measure('find (proxy)', find, NUMBER, proxy)
+    common.measure('insert_one (motor)', insert, WRITES, collection)
+    common.measure('insert_one (proxy)', insert, WRITES, proxy)
+
+    common.run(collection.drop)
+
+
+if __name__ == '__main__':
+    main()
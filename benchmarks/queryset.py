@@ -0,0 +1,56 @@
+import common
+
+from monstro import db
+
+
+NUMBER = 100000
+READS = 10000
+
+
+class Benchmark(db.Model):
+
+    name = db.String()
+    age = db.Integer()
+
+    class Meta:
+        collection = 'benchmark'
+
+
+async def get(number, _id, cached=True):
+    for __ in range(number):
+        if not cached:
+            Benchmark.Meta.query_plans.clear()
+
+        await Benchmark.objects.get(_id=_id)
+        await Benchmark.objects.filter(age__gte=1).get(name='name')
+
+
+async def chain(number):
+    for __ in range(number):
+        queryset = Benchmark.objects.filter(name='name').filter(age__gte=1)
+        queryset.order_by('-age').only('name', 'age')[10:20]
+
+
+async def chain_validate(number):
+    queryset = Benchmark.objects.filter(name='name').filter(age__gte=1)
+
+    for __ in range(number):
+        clone = queryset.order_by('-age').only('name')[10:20]
+        await clone.validate()
+
+
+def main():
+    common.measure('QuerySet chain construction', chain, NUMBER)
+    common.measure('QuerySet chain validate (shared)', chain_validate, NUMBER)
+
+    instance = common.run(Benchmark.objects.create, name='name', age=1)
+
+    common.measure('QuerySet.get (no plan cache)', get, READS, instance._id,
+                   cached=False)
+    common.measure('QuerySet.get (plan cache)', get, READS, instance._id)
+
+    common.run(Benchmark.Meta.collection.drop)
+
+
+if __name__ == '__main__':
+    main()
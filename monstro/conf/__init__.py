@@ -21,10 +21,18 @@ class SettingsForm(forms.Form):
             'alias': forms.String(default='default'),
             'uri': forms.String(),
             'name': forms.String(),
+            'read_preference': forms.String(required=False),
+            'max_pool_size': forms.Integer(required=False),
+            'min_pool_size': forms.Integer(required=False),
+            'wait_queue_timeout': forms.Integer(required=False),
+            'retry': forms.Map(default={}),
             'options': forms.Map(default={})
         })
     )
 
+    slow_query_threshold = forms.Float(required=False)
+    index_advisor = forms.Boolean(default=False)
+
     tornado_application_settings = forms.Map(default={})
 
     nosetests_arguments = forms.Array(field=forms.String(), default=[])
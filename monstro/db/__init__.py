@@ -1,5 +1,7 @@
 from monstro.utils import Choices
 
+from .aggregates import *  # pylint: disable=W0401
+from .cache import DocumentCache
 from .exceptions import ValidationError
 from .expressions import (
     Or,
@@ -7,6 +9,7 @@ from .expressions import (
     Raw
 )
 from .fields import *  # pylint: disable=W0401
+from .indexes import Index
 from .manager import Manager
 from .model import Model
 from .router import databases
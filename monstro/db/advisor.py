@@ -0,0 +1,168 @@
+import collections
+
+from monstro.conf import settings
+
+from .indexes import Index
+
+
+SHAPES_LIMIT = 1024
+
+EQUALITY = frozenset(('$eq', '$in'))
+
+
+class QueryShape(collections.namedtuple(
+        'QueryShape', ('model', 'equality', 'sort', 'range'))):
+
+    __slots__ = ()
+
+    @classmethod
+    def from_query(cls, model, query, sorts):
+        equality, ranges = set(), set()
+        cls.collect(query, equality, ranges)
+        ranges -= equality
+
+        return cls(
+            model, tuple(sorted(equality)), tuple(sorts), tuple(sorted(ranges))
+        )
+
+    @classmethod
+    def collect(cls, query, equality, ranges):
+        for key, value in query.items():
+            if key == '$and':
+                for item in value:
+                    cls.collect(item, equality, ranges)
+            elif key in ('$or', '$nor'):
+                for item in value:
+                    ranges.update(
+                        name for name in item if not name.startswith('$')
+                    )
+            elif key.startswith('$'):
+                continue
+            elif isinstance(value, dict) and value and all(
+                    operator.startswith('$') for operator in value):
+                if EQUALITY.issuperset(value):
+                    equality.add(key)
+                else:
+                    ranges.add(key)
+            elif hasattr(value, 'pattern'):
+                ranges.add(key)
+            else:
+                equality.add(key)
+
+    @property
+    def empty(self):
+        return not (self.equality or self.sort or self.range)
+
+    def get_keys(self):
+        keys = collections.OrderedDict((name, 1) for name in self.equality)
+
+        for name, direction in self.sort + tuple(
+                (name, 1) for name in self.range):
+            keys.setdefault(name, direction)
+
+        return list(keys.items())
+
+    def is_covered_by(self, keys):
+        keys = list(keys)
+        size = len(self.equality)
+
+        if {name for name, __ in keys[:size]} != set(self.equality):
+            return False
+
+        sort = keys[size:size + len(self.sort)]
+        inverted = [(name, -direction) for name, direction in self.sort]
+
+        if self.sort and sort not in (list(self.sort), inverted):
+            return False
+
+        if not (self.equality or self.sort):
+            return bool(keys) and keys[0][0] in self.range
+
+        return True
+
+
+class QueryStats(object):
+
+    __slots__ = ('count', 'total', 'maximum')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.maximum = 0.0
+
+    def add(self, elapsed):
+        self.count += 1
+        self.total += elapsed
+        self.maximum = max(self.maximum, elapsed)
+
+
+class IndexAdvisor(object):
+
+    def __init__(self, enabled=False, limit=SHAPES_LIMIT):
+        self.enabled = enabled
+        self.limit = limit
+        self.shapes = {}
+
+    def record(self, queryset, elapsed):
+        shape = QueryShape.from_query(
+            queryset.model, queryset.query, queryset.sorts
+        )
+
+        if shape.empty:
+            return
+
+        try:
+            stats = self.shapes[shape]
+        except KeyError:
+            if len(self.shapes) >= self.limit:
+                return
+
+            stats = self.shapes[shape] = QueryStats()
+
+        stats.add(elapsed)
+
+    def reset(self):
+        self.shapes.clear()
+
+    @staticmethod
+    async def get_index_keys(model):
+        cursor = model.Meta.collection.list_indexes()
+
+        return [
+            list(document['key'].items())
+            for document in await cursor.to_list(None)
+        ]
+
+    async def report(self):
+        indexes = {}
+        report = []
+
+        for shape, stats in list(self.shapes.items()):
+            if shape.model not in indexes:
+                indexes[shape.model] = await self.get_index_keys(shape.model)
+
+            covered = any(
+                shape.is_covered_by(keys) for keys in indexes[shape.model]
+            )
+
+            report.append({
+                'model': shape.model,
+                'filter': {
+                    'equality': list(shape.equality),
+                    'range': list(shape.range)
+                },
+                'sort': list(shape.sort),
+                'count': stats.count,
+                'total': stats.total,
+                'average': stats.total / stats.count,
+                'maximum': stats.maximum,
+                'covered': covered,
+                'suggestion': None if covered else Index(*shape.get_keys())
+            })
+
+        report.sort(key=lambda item: item['total'], reverse=True)
+
+        return report
+
+
+advisor = IndexAdvisor(getattr(settings, 'index_advisor', False))
@@ -0,0 +1,71 @@
+__all__ = (
+    'Sum',
+    'Avg',
+    'Min',
+    'Max',
+    'Count',
+)
+
+
+class Aggregate(object):
+
+    operator = None
+    requires_field = True
+
+    def __init__(self, field=None):
+        if field is None and self.requires_field:
+            raise TypeError(
+                '{} requires a field'.format(self.__class__.__name__)
+            )
+
+        self.field = field
+
+    @property
+    def name(self):
+        return '{}__{}'.format(self.field, self.__class__.__name__.lower())
+
+    def compile(self):
+        return {'${}'.format(self.operator): '${}'.format(self.field)}
+
+
+class Sum(Aggregate):
+
+    operator = 'sum'
+
+
+class Avg(Aggregate):
+
+    operator = 'avg'
+
+
+class Min(Aggregate):
+
+    operator = 'min'
+
+
+class Max(Aggregate):
+
+    operator = 'max'
+
+
+class Count(Aggregate):
+
+    operator = 'sum'
+    requires_field = False
+
+    @property
+    def name(self):
+        if self.field is None:
+            return 'count'
+
+        return super().name
+
+    def compile(self):
+        if self.field is None:
+            return {'$sum': 1}
+
+        return {'$sum': {'$cond': [
+            {'$eq': [{'$ifNull': ['${}'.format(self.field), None]}, None]},
+            0,
+            1
+        ]}}
@@ -0,0 +1,102 @@
+import collections
+import time
+
+import bson
+
+
+__all__ = (
+    'DocumentCache',
+)
+
+
+class DocumentCache(object):
+
+    def __init__(self, *, size=1024, ttl=60, fields=()):
+        self.size = size
+        self.ttl = ttl
+        self.fields = frozenset(fields)
+        self.entries = collections.OrderedDict()
+        self.aliases = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def copy(self):
+        return type(self)(size=self.size, ttl=self.ttl, fields=self.fields)
+
+    def get_stats(self):
+        return {
+            'size': len(self.entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'expirations': self.expirations
+        }
+
+    def is_cached(self, name):
+        return name == '_id' or name in self.fields
+
+    def get(self, name, value):
+        try:
+            _id = value if name == '_id' else self.aliases[(name, value)]
+            expires, raw, __ = self.entries[_id]
+        except (KeyError, TypeError):
+            self.misses += 1
+            return None
+
+        if expires < time.monotonic():
+            self.expirations += 1
+            self.misses += 1
+            self.discard(_id)
+            return None
+
+        self.entries.move_to_end(_id)
+        self.hits += 1
+
+        return bson.BSON(raw).decode()
+
+    def set(self, data):
+        _id = data.get('_id')
+
+        if _id is None:
+            return
+
+        self.discard(_id)
+
+        aliases = []
+
+        for name in self.fields:
+            try:
+                self.aliases[(name, data[name])] = _id
+            except (KeyError, TypeError):
+                continue
+
+            aliases.append((name, data[name]))
+
+        self.entries[_id] = (
+            time.monotonic() + self.ttl, bson.BSON.encode(data), aliases
+        )
+
+        while len(self.entries) > self.size:
+            __, (__, __, evicted) = self.entries.popitem(last=False)
+            self.evictions += 1
+
+            for alias in evicted:
+                self.aliases.pop(alias, None)
+
+    def discard(self, _id):
+        try:
+            __, __, aliases = self.entries.pop(_id)
+        except (KeyError, TypeError):
+            return
+
+        for alias in aliases:
+            self.aliases.pop(alias, None)
+
+    def clear(self):
+        self.entries.clear()
+        self.aliases.clear()
@@ -0,0 +1,174 @@
+import bson
+
+from monstro.forms.compiler import SYNC, ASYNC, get_validate_mode
+from monstro.forms.fields import Array, Map, JSON
+
+from .exceptions import ValidationError
+from .fields import ModelField
+
+
+SKIP = 0
+
+MUTABLE = (Array, Map, JSON)
+
+
+class Related(list):
+
+    __slots__ = ('raw',)
+
+    def __init__(self, values, raw):
+        super().__init__(values)
+        self.raw = raw
+
+
+class Codec(object):
+
+    def __init__(self, fields):
+        self.steps = []
+        self.loaders = {}
+        self.tracked = {}
+
+        for index, (name, field) in enumerate(fields.items()):
+            self.steps.append((
+                name,
+                field,
+                self.get_hook_mode(field, 'on_create', 'prepare_create'),
+                self.get_hook_mode(field, 'on_save', 'prepare_save'),
+                get_validate_mode(field),
+                self.get_codec_mode(field, 'db_serialize')
+            ))
+            self.loaders[name] = (
+                index, field, self.get_codec_mode(field, 'db_deserialize')
+            )
+
+            if isinstance(field, MUTABLE):
+                self.tracked[name] = self.is_shared(field)
+
+        self.hooked = frozenset(
+            name for name, field, __, save, __, __ in self.steps
+            if save is not SKIP and getattr(field, 'auto_now', True)
+        )
+
+    @staticmethod
+    def get_hook_mode(field, hook, prepare):
+        if getattr(type(field), hook) is not getattr(ModelField, hook):
+            return ASYNC
+        elif getattr(type(field), prepare) is getattr(ModelField, prepare):
+            return SKIP
+
+        return SYNC
+
+    @staticmethod
+    def is_shared(field):
+        if isinstance(field, Array):
+            return field.field is None or isinstance(field.field, MUTABLE)
+
+        return isinstance(field, Map)
+
+    def get_snapshot(self, data, names=None):
+        snapshot = {}
+
+        for name in self.tracked if names is None else names:
+            value = data.get(name)
+
+            if value is not None:
+                snapshot[name] = self.get_fingerprint(name, value)
+
+        return snapshot
+
+    def get_fingerprint(self, name, value):
+        if isinstance(value, Related):
+            value = value.raw
+
+        if value is not None and self.tracked[name]:
+            return bson.BSON.encode({name: value})
+
+        return value
+
+    @staticmethod
+    def get_codec_mode(field, method):
+        override = getattr(type(field), method)
+
+        if (field.synchronous
+                and override is getattr(ModelField, method)):
+            return SYNC
+
+        return ASYNC
+
+    async def dump(self, instance, created=False, validate=True, fields=None):
+        data = {}
+
+        for name, field, create, save, check, serialize in self.steps:
+            if fields is not None and name not in fields:
+                continue
+
+            value = instance.get_value(name)
+
+            if created and create is SYNC:
+                value = field.prepare_create(value)
+            elif created and create is ASYNC:
+                value = await field.on_create(value)
+
+            if not instance.is_loaded(name):
+                if created:
+                    instance.set_value(name, value)
+
+                continue
+
+            if save is SYNC:
+                value = field.prepare_save(value)
+            elif save is ASYNC:
+                value = await field.on_save(value)
+
+            if validate:
+                if field.read_only and name != '_id':
+                    value = field.default
+
+                try:
+                    if check is SYNC and not field.validators:
+                        value = field.clean(value)
+                    else:
+                        value = await field.validate(value)
+                except ValidationError as e:
+                    raise ValidationError({name: e.error})
+
+            instance.set_value(name, value)
+
+            if value is None:
+                continue
+            elif serialize is SYNC:
+                data[name] = field.db_to_primitive(value)
+            else:
+                data[name] = await field.db_serialize(value)
+
+        if validate and fields is None:
+            instance._raw_fields = ()
+
+        return data
+
+    async def load(self, model, data, raw_fields=(), fields=None):
+        instance = model()
+        values = instance._values
+        pending = {}
+
+        for name in self.loaders if fields is None else fields:
+            index, field, mode = self.loaders[name]
+            value = data.get(name)
+
+            if value is None or name in raw_fields:
+                values[index] = value
+            elif mode is SYNC and model.Meta.lazy:
+                pending[name] = value
+            else:
+                try:
+                    if mode is SYNC:
+                        values[index] = field.db_to_python(value)
+                    else:
+                        values[index] = await field.db_deserialize(value)
+                except ValidationError:
+                    values[index] = None
+
+        if pending:
+            instance._pending = pending
+
+        return instance
@@ -5,7 +5,9 @@ from monstro.forms.exceptions import ValidationError
 __all__ = (
     'ValidationError',
     'ORMError',
-    'InvalidQuery'
+    'InvalidQuery',
+    'DeferredFieldError',
+    'DatabaseUnavailable'
 )
 
 
@@ -22,3 +24,20 @@ class InvalidQuery(ORMError):
         self.model = model
         self.field = field
         self.query = query or {}
+
+
+class DeferredFieldError(ORMError):
+
+    def __init__(self, message, model, field):
+        super().__init__(message)
+
+        self.model = model
+        self.field = field
+
+
+class DatabaseUnavailable(ORMError):
+
+    def __init__(self, message, alias):
+        super().__init__(message)
+
+        self.alias = alias
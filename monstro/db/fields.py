@@ -48,18 +48,39 @@ class ModelField(object):
 
         self.model = None
 
+    def get_relation(self):
+        return None
+
+    def db_to_python(self, value):
+        return self.to_python(value)
+
+    def db_to_primitive(self, value):
+        return self.to_primitive(value)
+
     async def db_deserialize(self, value):
+        if self.synchronous:
+            return self.db_to_python(value)
+
         return await self.deserialize(value)
 
     async def db_serialize(self, value):
+        if self.synchronous:
+            return self.db_to_primitive(value)
+
         return await self.serialize(value)
 
-    async def on_save(self, value):
+    def prepare_save(self, value):
         return value
 
-    async def on_create(self, value):
+    def prepare_create(self, value):
         return value
 
+    async def on_save(self, value):
+        return self.prepare_save(value)
+
+    async def on_create(self, value):
+        return self.prepare_create(value)
+
 
 class String(ModelField, fields.String):
 
@@ -128,19 +149,19 @@ class JSON(ModelField, fields.JSON):
 
 class DateTime(ModelField, fields.DateTime):
 
-    async def db_serialize(self, value):
+    def db_to_primitive(self, value):
         return value
 
-    async def db_deserialize(self, value):
+    def db_to_python(self, value):
         return value
 
-    async def on_save(self, value):
+    def prepare_save(self, value):
         if self.auto_now:
             return datetime.datetime.utcnow()
 
         return value
 
-    async def on_create(self, value):
+    def prepare_create(self, value):
         if self.auto_now_on_create:
             return datetime.datetime.utcnow()
 
@@ -178,7 +199,7 @@ class Id(ModelField, fields.Field):
         kwargs['required'] = False
         super().__init__(**kwargs)
 
-    async def deserialize(self, value):
+    def to_python(self, value):
         if isinstance(value, str):
             try:
                 return ObjectId(value)
@@ -189,7 +210,7 @@ class Id(ModelField, fields.Field):
 
         return value
 
-    async def serialize(self, value):
+    def to_primitive(self, value):
         return str(value)
 
 
@@ -216,6 +237,18 @@ class ForeignKey(ModelField, fields.Field):
 
         return self.to
 
+    def get_relation(self):
+        return self
+
+    def get_lookup_value(self, value):
+        if isinstance(value, str) and self.to_field == '_id':
+            try:
+                return ObjectId(value)
+            except bson.errors.InvalidId:
+                self.fail('invalid')
+
+        return value
+
     async def deserialize(self, value):
         model = self.get_related_model()
 
@@ -224,13 +257,8 @@ class ForeignKey(ModelField, fields.Field):
                 self.fail('foreign_key')
 
             return value
-        elif isinstance(value, str) and self.to_field == '_id':
-            try:
-                value = ObjectId(value)
-            except bson.errors.InvalidId:
-                self.fail('invalid')
 
-        query = {self.to_field: value}
+        query = {self.to_field: self.get_lookup_value(value)}
 
         try:
             value = await model.objects.get(**query)
@@ -273,6 +301,15 @@ class ManyToMany(ModelField, fields.Array):
         field = ForeignKey(to=to, to_field=to_field)
         super().__init__(field=field, **kwargs)
 
+    def bind(self, **kwargs):
+        super().bind(**kwargs)
+
+        if 'model' in kwargs:
+            self.field.bind(model=kwargs['model'])
+
+    def get_relation(self):
+        return self.field
+
     async def get_options(self):
         options = await super().get_options()
 
@@ -0,0 +1,88 @@
+import functools
+
+import tornado.stack_context
+
+
+class IdentityMap(object):
+
+    def __init__(self):
+        self.instances = {}
+
+    def __len__(self):
+        return len(self.instances)
+
+    @staticmethod
+    def get_key(model, _id):
+        return model.Meta.collection.full_name, _id
+
+    def get(self, model, _id):
+        try:
+            instance = self.instances.get(self.get_key(model, _id))
+        except TypeError:
+            return None
+
+        if isinstance(instance, model):
+            return instance
+
+        return None
+
+    def add(self, instance):
+        if instance._id is not None:
+            key = self.get_key(type(instance), instance._id)
+            self.instances[key] = instance
+
+    def discard(self, instance):
+        if instance._id is not None:
+            key = self.get_key(type(instance), instance._id)
+            self.instances.pop(key, None)
+
+    def discard_model(self, model):
+        collection = model.Meta.collection.full_name
+
+        for key in [key for key in self.instances if key[0] == collection]:
+            del self.instances[key]
+
+    def clear(self):
+        self.instances.clear()
+
+
+class Local(object):
+
+    __slots__ = ('identity_map',)
+
+    def __init__(self):
+        self.identity_map = None
+
+
+local = Local()
+
+
+class Scope(object):
+
+    __slots__ = ('identity_map', 'previous')
+
+    def __init__(self, identity_map):
+        self.identity_map = identity_map
+        self.previous = None
+
+    def __enter__(self):
+        self.previous = local.identity_map
+        local.identity_map = self.identity_map
+
+        return self.identity_map
+
+    def __exit__(self, *args):
+        local.identity_map = self.previous
+
+
+def get_identity_map():
+    return local.identity_map
+
+
+def scope(identity_map=None):
+    if identity_map is None:
+        identity_map = IdentityMap()
+
+    return tornado.stack_context.StackContext(
+        functools.partial(Scope, identity_map)
+    )
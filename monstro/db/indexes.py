@@ -0,0 +1,131 @@
+import collections
+
+import pymongo
+
+
+__all__ = (
+    'Index',
+)
+
+
+class Index(object):
+
+    defaults = {'unique': False, 'sparse': False}
+
+    def __init__(self, *keys, name=None, unique=False, sparse=False,
+                 partial=None, ttl=None, background=True):
+
+        self.keys = tuple(self.get_key(key) for key in keys)
+        self.name = name or '_'.join(
+            '{}_{}'.format(key, direction) for key, direction in self.keys
+        )
+        self.unique = unique
+        self.sparse = sparse
+        self.partial = partial
+        self.ttl = ttl
+        self.background = background
+
+    def __repr__(self):
+        return 'Index({})'.format(self.name)
+
+    @staticmethod
+    def get_key(key):
+        if isinstance(key, (tuple, list)):
+            return tuple(key)
+        elif key.startswith('-'):
+            return key[1:], pymongo.DESCENDING
+
+        return key, pymongo.ASCENDING
+
+    @property
+    def options(self):
+        options = {'unique': self.unique, 'sparse': self.sparse}
+
+        if self.partial is not None:
+            options['partialFilterExpression'] = self.partial
+
+        if self.ttl is not None:
+            options['expireAfterSeconds'] = self.ttl
+
+        return options
+
+    def has_keys(self, document):
+        return tuple(document['key'].items()) == self.keys
+
+    def matches(self, document):
+        if not self.has_keys(document):
+            return False
+
+        return all(
+            document.get(option, self.defaults.get(option)) == value
+            for option, value in self.options.items()
+        )
+
+    async def create(self, collection):
+        await collection.create_index(
+            list(self.keys),
+            name=self.name,
+            background=self.background,
+            **self.options
+        )
+
+
+def get_indexes(model):
+    indexes = collections.OrderedDict()
+
+    for name, field in model.Meta.fields.items():
+        if field.index is not None:
+            index = Index(
+                (name, field.index), unique=field.unique, sparse=True
+            )
+            indexes[index.name] = index
+
+    for index in getattr(model.Meta, 'indexes', ()):
+        indexes[index.name] = index
+
+    return tuple(indexes.values())
+
+
+async def sync(model, drop=False):
+    collection = model.Meta.collection
+    existing = {}
+
+    for document in await collection.list_indexes().to_list(None):
+        if document['name'] != '_id_':
+            existing[document['name']] = document
+
+    result = {'created': [], 'dropped': [], 'stale': []}
+
+    for index in model.Meta.indexes:
+        document = existing.pop(index.name, None)
+
+        if document is None:
+            document = next((
+                document for document in existing.values()
+                if index.has_keys(document)
+            ), None)
+
+            if document is not None:
+                del existing[document['name']]
+
+        if document is not None and index.matches(document):
+            continue
+        elif document is not None:
+            if not drop:
+                result['stale'].append(document['name'])
+                continue
+
+            await collection.drop_index(document['name'])
+            result['dropped'].append(document['name'])
+
+        await index.create(collection)
+        result['created'].append(index.name)
+
+    for name in existing:
+        if drop:
+            await collection.drop_index(name)
+            result['dropped'].append(name)
+        else:
+            result['stale'].append(name)
+
+    return result
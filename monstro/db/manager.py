@@ -1,6 +1,13 @@
+import pymongo
+import pymongo.errors
+
+from .exceptions import InvalidQuery
 from .queryset import QuerySet
 
 
+DUPLICATE_KEY_ERROR = 11000
+
+
 class Manager(object):
 
     def bind(self, **kwargs):
@@ -11,3 +18,163 @@ class Manager(object):
 
     async def create(self, **kwargs):
         return await self.model(**kwargs).save()
+
+    def get_write_errors(self, error, instances, offset=0):
+        errors = {}
+
+        for write_error in error.details.get('writeErrors', []):
+            index = write_error['index'] + offset
+
+            if write_error.get('code') == DUPLICATE_KEY_ERROR:
+                instance = instances[index]
+                field = instance.get_unique_field(write_error['errmsg'])
+                errors[index] = {field: instance.Meta.errors['unique']}
+            else:
+                errors[index] = write_error['errmsg']
+
+        return errors
+
+    async def prepare_bulk(self, instances):
+        documents = []
+        errors = {}
+
+        for index, instance in enumerate(instances):
+            try:
+                documents.append(await instance.pre_save())
+            except self.model.ValidationError as e:
+                errors[index] = e.error
+
+        if errors:
+            raise self.model.ValidationError(errors)
+
+        return documents
+
+    async def bulk_create(self, instances, batch_size=None, ordered=False):
+        instances = list(instances)
+
+        if not instances:
+            return instances
+
+        documents = await self.prepare_bulk(instances)
+        batch_size = batch_size or len(documents)
+        errors = {}
+
+        for document, instance in zip(documents, instances):
+            if instance._id:
+                document['_id'] = instance._id
+
+        for offset in range(0, len(documents), batch_size):
+            batch = documents[offset:offset + batch_size]
+            inserted = len(batch)
+
+            try:
+                await self.model.Meta.collection.insert_many(
+                    batch, ordered=ordered
+                )
+            except pymongo.errors.BulkWriteError as e:
+                failed = self.get_write_errors(e, instances, offset)
+                errors.update(failed)
+
+                if ordered:
+                    inserted = min(failed, default=offset + inserted) - offset
+
+            for index, document in enumerate(batch[:inserted], offset):
+                if index not in errors:
+                    instances[index].set_value('_id', document['_id'])
+
+            if errors and ordered:
+                break
+
+        if errors:
+            raise self.model.ValidationError(errors)
+
+        return instances
+
+    async def bulk_update(self, instances, fields=None, batch_size=None,
+                          ordered=False):
+
+        instances = list(instances)
+
+        for name in fields or ():
+            if name not in self.model.Meta.fields:
+                raise InvalidQuery(
+                    '{} has not field {}'.format(self.model, name),
+                    model=self.model,
+                    field=name,
+                )
+
+        for index, instance in enumerate(instances):
+            if not instance._id:
+                raise self.model.ValidationError({
+                    index: {'_id': self.model.Meta.fields['_id'].errors[
+                        'required'
+                    ]}
+                })
+
+            for name in fields or ():
+                if not instance.is_loaded(name):
+                    raise InvalidQuery(
+                        '{} field {} is not loaded'.format(self.model, name),
+                        model=self.model,
+                        field=name,
+                    )
+
+        documents = await self.prepare_bulk(instances)
+        names = fields or [
+            name for name in self.model.Meta.fields if name != '_id'
+        ]
+        operations = []
+        indexes = []
+        errors = {}
+        matched = 0
+
+        for index, instance in enumerate(instances):
+            update = instance.get_partial_update(documents[index], names)
+
+            if update:
+                operations.append(
+                    pymongo.UpdateOne({'_id': instance._id}, update)
+                )
+                indexes.append(index)
+
+        if not operations:
+            return matched
+
+        batch_size = batch_size or len(operations)
+        targets = [instances[index] for index in indexes]
+
+        for offset in range(0, len(operations), batch_size):
+            failed = {}
+            end = min(offset + batch_size, len(operations))
+
+            try:
+                result = await self.model.Meta.collection.bulk_write(
+                    operations[offset:end], ordered=ordered
+                )
+            except pymongo.errors.BulkWriteError as e:
+                failed = self.get_write_errors(e, targets, offset)
+                matched += e.details.get('nMatched', 0)
+            else:
+                matched += result.matched_count
+
+            for position in range(offset, end):
+                if position in failed:
+                    errors[indexes[position]] = failed[position]
+
+                    if ordered:
+                        break
+                elif fields is None or targets[position]._dirty is not None:
+                    targets[position].track(
+                        documents[indexes[position]], names
+                    )
+
+            if failed and ordered:
+                break
+
+        for instance in instances:
+            instance.invalidate()
+
+        if errors:
+            raise self.model.ValidationError(errors)
+
+        return matched
@@ -4,12 +4,62 @@ import re
 
 import pymongo.errors
 
-from . import manager
-from .exceptions import ValidationError
+from . import identity, indexes, manager
+from .codec import Codec
+from .exceptions import ValidationError, DeferredFieldError
 from .fields import ModelField, Id
 from .router import databases
 
 
+MISSING = object()
+
+
+class FieldDescriptor(object):
+
+    __slots__ = ('name', 'index', 'field')
+
+    def __init__(self, name, index, field):
+        self.name = name
+        self.index = index
+        self.field = field
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self.field
+
+        value = instance._values[self.index]
+
+        if value is MISSING:
+            if instance._pending and self.name in instance._pending:
+                return instance.get_value(self.name)
+
+            if self.name in instance._deferred:
+                raise DeferredFieldError(
+                    '{} field {} is deferred'.format(
+                        owner.__name__, self.name
+                    ),
+                    model=owner,
+                    field=self.name
+                )
+
+            value = self.field.default
+            instance._values[self.index] = value
+
+        return value
+
+    def __set__(self, instance, value):
+        instance._values[self.index] = value
+
+        if instance._pending:
+            instance._pending.pop(self.name, None)
+
+        if instance._loaded is not None:
+            instance.load_field(self.name)
+
+        if instance._dirty is not None:
+            instance._dirty.add(self.name)
+
+
 class MetaModel(type):
 
     errors = {
@@ -38,6 +88,15 @@ class MetaModel(type):
 
         attributes.setdefault('Meta', type('Meta', (), {}))
 
+        slots = tuple(
+            slot for slot in ('__dict__', '__weakref__')
+            if not any(slot in vars(klass)
+                       for parent in bases for klass in parent.__mro__)
+        )
+
+        if slots:
+            attributes.setdefault('__slots__', slots)
+
         cls = super().__new__(mcs, name, bases, attributes)
 
         for field in fields.values():
@@ -50,44 +109,69 @@ class MetaModel(type):
         cls.objects.bind(model=cls)
 
         cls.Meta.fields = fields
+        cls.Meta.codec = Codec(fields)
+        cls.Meta.positions = {}
+
+        for index, (key, field) in enumerate(fields.items()):
+            cls.Meta.positions[key] = index
+            mcs.bind_descriptor(cls, FieldDescriptor(key, index, field))
+
+        cls.Meta.database = getattr(cls.Meta, 'database', 'default')
+        cls.Meta.readers = {}
+        cls.Meta.bindings = {}
+        cls.Meta.cache = getattr(cls.Meta, 'cache', None)
 
         if hasattr(cls.Meta, 'collection'):
-            alias = getattr(cls.Meta, 'database', 'default')
+            alias = cls.Meta.database
             cls.Meta.collection = databases.get(alias)[cls.Meta.collection]
+            cls.Meta.collection.model = cls
 
         errors = mcs.errors.copy()
         errors.update(getattr(cls.Meta, 'errors', {}))
         cls.Meta.errors = errors
 
+        cls.Meta.indexes = indexes.get_indexes(cls)
+        cls.Meta.lazy = getattr(cls.Meta, 'lazy', False)
+        cls.Meta.query_plans = {}
+
         return cls
 
+    @staticmethod
+    def bind_descriptor(cls, descriptor):
+        for parent in cls.__mro__:
+            if descriptor.name in parent.__dict__:
+                attribute = parent.__dict__[descriptor.name]
+
+                if not isinstance(attribute, FieldDescriptor):
+                    return
+
+                break
+
+        setattr(cls, descriptor.name, descriptor)
+
 
 class Model(object, metaclass=MetaModel):
 
-    def __new__(cls, *args, **kwargs):
-        self = object.__new__(cls)
-        self.Meta = cls.Meta()
-        return self
+    __slots__ = (
+        '_values', '_raw_fields', '_loaded', '_deferred', '_pending',
+        '_dirty', '_snapshot'
+    )
 
     def __init__(self, **kwargs):
-        self.Meta.data = kwargs
-
-    def __getattr__(self, attribute):
-        if attribute in self.Meta.fields:
-            try:
-                return self.Meta.data[attribute]
-            except KeyError:
-                value = self.Meta.fields[attribute].default
-                self.Meta.data[attribute] = value
-                return value
+        positions = self.Meta.positions
+        values = [MISSING] * len(positions)
 
-        raise AttributeError(attribute)
+        for key, value in kwargs.items():
+            if key in positions:
+                values[positions[key]] = value
 
-    def __setattr__(self, attribute, value):
-        if attribute in self.Meta.fields:
-            self.Meta.data[attribute] = value
-        else:
-            return super().__setattr__(attribute, value)
+        self._values = values
+        self._raw_fields = ()
+        self._loaded = None
+        self._deferred = ()
+        self._pending = None
+        self._dirty = None
+        self._snapshot = None
 
     def __str__(self):
         return '{} object'.format(self.__class__.__name__)
@@ -106,55 +190,139 @@ class Model(object, metaclass=MetaModel):
 
     @classmethod
     def using(cls, *, database='default', collection=None):
-        database = databases.get(database)
-        collection = database[collection or cls.Meta.collection.name]
-        model = cls.__new__(cls)
+        instance = databases.get(database)
+        key = (database, collection or cls.Meta.collection.name)
 
-        model.Meta.collection = collection
+        try:
+            bound, model = cls.Meta.bindings[key]
+        except KeyError:
+            pass
+        else:
+            if bound is instance:
+                return model
+
+        collection = instance[key[1]]
+        cache = cls.Meta.cache
+        meta = type('Meta', (cls.Meta,), {
+            'collection': collection,
+            'database': database,
+            'readers': {},
+            'cache': None if cache is None else cache.copy()
+        })
+        model = type.__new__(
+            type(cls), cls.__name__, (cls,), {'Meta': meta, '__slots__': ()}
+        )
+
+        model.objects = type(cls.objects)()
         model.objects.bind(model=model)
+        collection.model = model
+        cls.Meta.bindings[key] = (instance, model)
 
         return model
 
+    def get_value(self, name, default=None):
+        index = self.Meta.positions[name]
+        value = self._values[index]
+
+        if value is not MISSING:
+            return value
+
+        if self._pending and name in self._pending:
+            value = self._pending.pop(name)
+
+            try:
+                value = self.Meta.fields[name].db_to_python(value)
+            except self.ValidationError:
+                value = None
+
+            self._values[index] = value
+            return value
+
+        return default
+
+    def set_value(self, name, value):
+        if self._pending:
+            self._pending.pop(name, None)
+
+        self._values[self.Meta.positions[name]] = value
+
+    def load_field(self, name):
+        if self._loaded is not None and name in self.Meta.positions:
+            self._loaded.add(name)
+            self._deferred = self._deferred - {name}
+
+    def is_loaded(self, name):
+        return self._loaded is None or name in self._loaded
+
+    def mark_dirty(self, *names):
+        if self._dirty is not None:
+            self._dirty.update(
+                name for name in names if name in self.Meta.positions
+            )
+
+    def track(self, data, names=None):
+        codec = self.Meta.codec
+
+        if names is None or self._dirty is None:
+            self._snapshot = codec.get_snapshot(data)
+            self._dirty = set()
+            return
+
+        tracked = codec.tracked.keys() & names
+
+        for name in tracked:
+            self._snapshot.pop(name, None)
+
+        self._snapshot.update(codec.get_snapshot(data, tracked))
+        self._dirty.difference_update(names)
+
+    def is_changed(self, name, data):
+        if name in self._dirty:
+            return True
+
+        return self._snapshot.get(name) != self.Meta.codec.get_fingerprint(
+            name, data.get(name)
+        )
+
     def fail(self, code, field):
         raise self.ValidationError({field: self.Meta.errors[code]})
 
     @classmethod
-    async def from_db(cls, data, raw_fields=()):
-        for name, field in cls.Meta.fields.items():
-            value = data.get(name)
+    async def from_db(cls, data, raw_fields=(), fields=None, deferred=()):
+        snapshot = cls.Meta.codec.get_snapshot(data)
+        instance = await cls.Meta.codec.load(cls, data, raw_fields, fields)
+        instance._raw_fields = raw_fields
+        instance._snapshot = snapshot
+        instance._dirty = set()
 
-            if value is None or name in raw_fields:
-                data[name] = value
-            else:
-                try:
-                    data[name] = await field.db_deserialize(value)
-                except cls.ValidationError:
-                    data[name] = None
+        if fields is not None:
+            instance._loaded = set(fields)
+            instance._deferred = frozenset(deferred)
+        elif not raw_fields:
+            identity_map = identity.get_identity_map()
+
+            if identity_map is not None:
+                existing = identity_map.get(cls, instance._id)
 
-        instance = cls(**data)
-        instance.Meta.raw_fields = raw_fields
+                if existing is not None:
+                    return existing
+
+                identity_map.add(instance)
 
         return instance
 
     @classmethod
-    async def prepare(cls):
-        for name, field in cls.Meta.fields.items():
-            if field.index is not None:
-                await cls.Meta.collection.create_index(
-                    ((name, field.index),),
-                    unique=field.unique,
-                    sparse=True,
-                    background=True
-                )
+    async def prepare(cls, drop=False):
+        return await indexes.sync(cls, drop)
 
     async def deserialize(self):
         for name, field in self.Meta.fields.items():
-            value = self.Meta.data.get(name, field.default)
+            value = self.get_value(name, field.default)
 
             if value is not None:
                 value = await field.deserialize(value)
 
-            self.Meta.data[name] = value
+            self.set_value(name, value)
 
         return self
 
@@ -162,7 +330,7 @@ class Model(object, metaclass=MetaModel):
         data = {}
 
         for name, field in self.Meta.fields.items():
-            value = self.Meta.data.get(name)
+            value = self.get_value(name)
 
             if value is None:
                 data[name] = value
@@ -175,7 +343,10 @@ class Model(object, metaclass=MetaModel):
         data = {}
 
         for name, field in self.Meta.fields.items():
-            value = self.Meta.data.get(name)
+            if not self.is_loaded(name):
+                continue
+
+            value = self.get_value(name)
 
             if value is not None:
                 data[name] = await field.db_serialize(value)
@@ -184,7 +355,10 @@ class Model(object, metaclass=MetaModel):
 
     async def validate(self):
         for name, field in self.Meta.fields.items():
-            value = self.Meta.data.get(name)
+            if not self.is_loaded(name):
+                continue
+
+            value = self.get_value(name)
 
             if field.read_only and name != '_id':
                 value = field.default
@@ -194,56 +368,146 @@ class Model(object, metaclass=MetaModel):
             except self.ValidationError as e:
                 raise self.ValidationError({name: e.error})
 
-            self.Meta.data[name] = value
+            self.set_value(name, value)
 
-        self.Meta.raw_fields = ()
+        self._raw_fields = ()
         return self
 
     async def on_save(self):
         for name, field in self.Meta.fields.items():
-            value = self.Meta.data.get(name)
-            self.Meta.data[name] = await field.on_save(value)
+            if not self.is_loaded(name):
+                continue
+
+            value = self.get_value(name)
+            self.set_value(name, await field.on_save(value))
 
     async def on_create(self):
         for name, field in self.Meta.fields.items():
-            value = self.Meta.data.get(name)
-            self.Meta.data[name] = await field.on_create(value)
+            value = self.get_value(name)
+            self.set_value(name, await field.on_create(value))
 
-    async def save(self, force=False):
-        if not self._id:
-            await self.on_create()
+    @staticmethod
+    def get_unique_field(error):
+        return re.search(r'\$?(\w+)_\d+', str(error)).group(1)
 
-        await self.on_save()
+    async def pre_save(self, force=False):
+        data = await self.Meta.codec.dump(
+            self, created=not self._id, validate=not force
+        )
+        data.pop('_id', None)
 
-        if not force:
-            await self.validate()
+        return data
 
-        data = await self.db_serialize()
-        data.pop('_id', None)
+    def invalidate(self):
+        identity_map = identity.get_identity_map()
+
+        if identity_map is not None:
+            identity_map.discard(self)
+
+        if self.Meta.cache is not None:
+            self.Meta.cache.discard(self._id)
+
+    @classmethod
+    def invalidate_all(cls):
+        identity_map = identity.get_identity_map()
+
+        if identity_map is not None:
+            identity_map.discard_model(cls)
+
+        if cls.Meta.cache is not None:
+            cls.Meta.cache.clear()
+
+    async def save(self, force=False):
+        names = None
+
+        if self._id and self._dirty is not None:
+            data, names = await self.get_changes(force)
+
+            if not names:
+                return self
+        else:
+            data = await self.pre_save(force)
 
         try:
-            if self._id:
+            if names is not None:
+                await self.Meta.collection.update(
+                    {'_id': self._id}, self.get_partial_update(data, names)
+                )
+            elif self._id:
                 await self.Meta.collection.update({'_id': self._id}, data)
             else:
-                self.Meta.data['_id'] = await self.Meta.collection.insert(data)
+                self.set_value('_id', await self.Meta.collection.insert(data))
         except pymongo.errors.DuplicateKeyError as e:
-            field = re.search(r'\$?(\w+)_\d+', str(e)).group(1)
-            self.fail('unique', field)
+            self.fail('unique', self.get_unique_field(e))
+        finally:
+            self.invalidate()
+
+        self.track(data, names)
 
         return self
 
+    async def get_changes(self, force=False):
+        codec = self.Meta.codec
+        names = self._dirty.union(self._snapshot)
+        names.discard('_id')
+
+        if not names:
+            return {}, names
+
+        data = await codec.dump(self, validate=not force, fields=names)
+        names = {name for name in names if self.is_changed(name, data)}
+
+        if names:
+            hooked = codec.hooked.difference(names, ('_id',))
+
+            if hooked:
+                data.update(await codec.dump(
+                    self, validate=not force, fields=hooked
+                ))
+                names.update(hooked)
+
+        return data, names
+
+    def get_partial_update(self, data, names):
+        update = {}
+
+        for name in names:
+            if not self.is_loaded(name):
+                continue
+            elif name in data:
+                update.setdefault('$set', {})[name] = data[name]
+            else:
+                update.setdefault('$unset', {})[name] = ''
+
+        return update
+
     async def update(self, **kwargs):
         for key, value in kwargs.items():
-            self.Meta.data[key] = value
+            if key in self.Meta.positions:
+                self.set_value(key, value)
+                self.load_field(key)
+                self.mark_dirty(key)
 
         return await self.save()
 
     async def refresh(self):
         if self._id:
             data = await self.Meta.collection.find_one({'_id': self._id})
-            self.Meta.data.update(data)
+            self._pending = None
+            self._loaded = None
+            self._deferred = ()
+
+            for name, value in data.items():
+                if name in self.Meta.positions:
+                    self.set_value(name, value)
+
+            self.track(data)
+
             return await self.deserialize()
 
     async def delete(self):
         if self._id:
-            await self.Meta.collection.remove({'_id': self._id})
+            try:
+                await self.Meta.collection.remove({'_id': self._id})
+            finally:
+                self.invalidate()
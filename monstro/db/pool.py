@@ -0,0 +1,118 @@
+import collections
+import threading
+import time
+
+import pymongo.monitoring
+
+
+OPTIONS = {
+    'max_pool_size': 'maxPoolSize',
+    'min_pool_size': 'minPoolSize',
+    'wait_queue_timeout': 'waitQueueTimeoutMS'
+}
+
+# Connection pool events are only published from PyMongo 3.9 on.
+ConnectionPoolListener = getattr(
+    pymongo.monitoring, 'ConnectionPoolListener', None
+)
+
+
+def get_client_options(database, metrics):
+    options = dict(database.get('options') or {})
+
+    for key, option in OPTIONS.items():
+        if database.get(key) is not None:
+            options[option] = database[key]
+
+    if metrics is not None:
+        options['event_listeners'] = list(
+            options.get('event_listeners', ())
+        ) + [metrics]
+
+    return options
+
+
+def get_pool_metrics():
+    if ConnectionPoolListener is None:
+        return None
+
+    return PoolMetrics()
+
+
+class PoolMetrics(ConnectionPoolListener or object):
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.waiting = collections.defaultdict(collections.deque)
+        self.connections = 0
+        self.checked_out = 0
+        self.checkouts = 0
+        self.failures = 0
+        self.wait_time = 0.0
+        self.max_wait_time = 0.0
+
+    @property
+    def waiters(self):
+        return sum(len(starts) for starts in self.waiting.values())
+
+    def get(self):
+        with self.lock:
+            return {
+                'connections': self.connections,
+                'checked_out': self.checked_out,
+                'waiters': self.waiters,
+                'checkouts': self.checkouts,
+                'failures': self.failures,
+                'wait_time': self.wait_time,
+                'max_wait_time': self.max_wait_time
+            }
+
+    def stop_waiting(self, event):
+        try:
+            start = self.waiting[event.address].popleft()
+        except IndexError:
+            return
+
+        elapsed = time.perf_counter() - start
+        self.wait_time += elapsed
+        self.max_wait_time = max(self.max_wait_time, elapsed)
+
+    def pool_created(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        pass
+
+    def pool_closed(self, event):
+        with self.lock:
+            self.waiting.pop(event.address, None)
+
+    def connection_created(self, event):
+        with self.lock:
+            self.connections += 1
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_closed(self, event):
+        with self.lock:
+            self.connections -= 1
+
+    def connection_check_out_started(self, event):
+        with self.lock:
+            self.waiting[event.address].append(time.perf_counter())
+
+    def connection_check_out_failed(self, event):
+        with self.lock:
+            self.stop_waiting(event)
+            self.failures += 1
+
+    def connection_checked_out(self, event):
+        with self.lock:
+            self.stop_waiting(event)
+            self.checked_out += 1
+            self.checkouts += 1
+
+    def connection_checked_in(self, event):
+        with self.lock:
+            self.checked_out -= 1
@@ -1,4 +1,6 @@
+import functools
 import logging
+import time
 
 import pymongo
 import motor.motor_tornado
@@ -6,6 +8,9 @@ import motor.motor_tornado
 
 logger = logging.getLogger('monstro')
 
+PROXIED = 'proxied'
+CURSOR = 'cursor'
+
 
 def autoreconnect(retries=None):
 
@@ -29,35 +34,252 @@ def autoreconnect(retries=None):
     return decorator
 
 
+def normalize(query):
+    if isinstance(query, dict):
+        return {key: normalize(value) for key, value in query.items()}
+    elif (isinstance(query, (list, tuple)) and query
+          and all(isinstance(item, dict) for item in query)):
+        return [normalize(item) for item in query]
+
+    return '?'
+
+
+class Operation(object):
+
+    __slots__ = ('model', 'name', 'filter', 'sort', 'projection')
+
+    def __init__(self, model, name, query=None, sort=None, projection=None):
+        self.model = model
+        self.name = name
+        self.filter = query
+        self.sort = sort
+        self.projection = projection
+
+    @classmethod
+    def from_call(cls, model, name, args, kwargs):
+        if name in SlowQueryLog.inserts:
+            return cls(model, name)
+
+        query = args[0] if args else kwargs.get(
+            'filter', kwargs.get('spec', kwargs.get('pipeline'))
+        )
+
+        if name in ('find', 'find_one'):
+            projection = args[1] if len(args) > 1 else kwargs.get(
+                'projection', kwargs.get('fields')
+            )
+        else:
+            projection = None
+
+        return cls(model, name, query, kwargs.get('sort'), projection)
+
+    def describe(self):
+        return 'filter={} sort={} projection={}'.format(
+            None if self.filter is None else normalize(self.filter),
+            self.sort,
+            self.projection
+        )
+
+
+class SlowQueryLog(object):
+
+    inserts = frozenset(('insert', 'insert_one', 'insert_many', 'bulk_write'))
+    operations = inserts | frozenset((
+        'find', 'aggregate', 'find_one', 'count', 'count_documents',
+        'estimated_document_count', 'distinct', 'update', 'update_one',
+        'update_many', 'replace_one', 'remove', 'delete_one', 'delete_many',
+        'find_one_and_update', 'find_one_and_replace', 'find_one_and_delete',
+        'save'
+    ))
+    fetches = frozenset(('to_list', 'count', 'distinct'))
+
+    def __init__(self, threshold=None):
+        self.threshold = threshold
+
+    def measure(self, future, start, operation, name=None):
+        threshold = self.threshold
+
+        def done(_):
+            elapsed = (time.perf_counter() - start) * 1000
+
+            if elapsed >= threshold:
+                self.log(operation, name or operation.name, elapsed)
+
+        if hasattr(future, 'add_done_callback'):
+            future.add_done_callback(done)
+
+        return future
+
+    @staticmethod
+    def log(operation, name, elapsed):
+        if name != operation.name:
+            name = '{}.{}'.format(operation.name, name)
+
+        model = operation.model
+
+        logger.warning('Slow query {} on {}: {:.2f} ms {}'.format(
+            name,
+            None if model is None else model.__name__,
+            elapsed,
+            operation.describe()
+        ))
+
+
+slow_queries = SlowQueryLog()
+
+
+class Method(object):
+
+    __slots__ = ('proxy', 'function', 'name')
+
+    def __init__(self, proxy, function, name):
+        self.proxy = proxy
+        self.function = function
+        self.name = name
+
+    def __call__(self, *args, **kwargs):
+        proxy = self.proxy
+
+        if slow_queries.threshold is not None and proxy.is_profiled(
+                self.name):
+            return proxy.profile(self.function, self.name, args, kwargs)
+
+        return proxy.call(self.function, self.name, args, kwargs)
+
+
 class MotorProxy(object):
 
+    cursors = (
+        motor.motor_tornado.MotorCursor,
+        motor.motor_tornado.MotorCommandCursor
+    )
     objects = (
         motor.MotorCollection,
         motor.MotorDatabase,
         motor.MotorGridFS,
         motor.MotorGridIn,
         motor.MotorGridOut,
-        motor.MotorBulkOperationBuilder,
-        motor.motor_tornado.MotorCursor
-    )
+        motor.MotorBulkOperationBuilder
+    ) + cursors
+    kinds = {}
 
-    def __init__(self, instance):
+    def __init__(self, instance, model=None, operation=None, policy=None):
         self.instance = instance
+        self.model = model
+        self.operation = operation
+        self.policy = policy
+        self.factory = None
+        self.cached = self.get_kind(instance) is not CURSOR
+
+    @classmethod
+    def get_kind(cls, object):  # pylint: disable=W0622
+        kind = type(object)
+
+        try:
+            return cls.kinds[kind]
+        except KeyError:
+            pass
+
+        if issubclass(kind, cls.cursors):
+            cls.kinds[kind] = CURSOR
+        elif issubclass(kind, cls.objects):
+            cls.kinds[kind] = PROXIED
+        else:
+            cls.kinds[kind] = None
+
+        return cls.kinds[kind]
+
+    @classmethod
+    def is_proxied(cls, object):  # pylint: disable=W0622
+        return cls.get_kind(object) is not None
 
     @classmethod
-    def wrap(cls, object):  # pylint: disable=W0622
-        if isinstance(object, cls.objects):
-            return cls(object)
+    def wrap(cls, object, policy=None):  # pylint: disable=W0622
+        if cls.is_proxied(object):
+            return cls(object, policy=policy)
         elif callable(object):
             return autoreconnect()(object)
 
         return object
 
+    def call(self, function, name, args, kwargs):
+        policy = self.policy
+
+        if policy is None:
+            result = autoreconnect()(function)(*args, **kwargs)
+        else:
+            result = self.wrap(
+                policy.call(
+                    function, name, args, kwargs, self.get_restart(name)
+                ),
+                policy
+            )
+
+        if (self.cached and isinstance(result, MotorProxy)
+                and not result.cached):
+            result.factory = functools.partial(function, *args, **kwargs)
+
+        return result
+
+    def get_restart(self, name):
+        instance = self.instance
+
+        if name != 'to_list' or self.cached or instance.started:
+            return None
+        elif hasattr(instance, 'clone'):
+            create = instance.clone
+        elif self.factory is not None:
+            create = self.factory
+        else:
+            return None
+
+        def restart():
+            self.instance = create()
+            return getattr(self.instance, name)
+
+        return restart
+
+    def profile(self, function, name, args, kwargs):
+        start = time.perf_counter()
+        result = self.call(function, name, args, kwargs)
+
+        if self.operation is not None:
+            return slow_queries.measure(result, start, self.operation, name)
+
+        operation = Operation.from_call(self.model, name, args, kwargs)
+
+        if isinstance(result, MotorProxy):
+            result.operation = operation
+            return result
+
+        return slow_queries.measure(result, start, operation)
+
+    def is_profiled(self, attribute):
+        if self.operation is not None:
+            return attribute in SlowQueryLog.fetches
+
+        return (
+            attribute in SlowQueryLog.operations
+            and isinstance(self.instance, motor.MotorCollection)
+        )
+
     def __getattr__(self, attribute):
-        return self.wrap(getattr(self.instance, attribute))
+        value = getattr(self.instance, attribute)
+
+        if self.is_proxied(value):
+            value = MotorProxy(value, policy=self.policy)
+        elif callable(value):
+            value = Method(self, value, attribute)
+        else:
+            return value
+
+        if self.cached:
+            self.__dict__[attribute] = value
+
+        return value
 
     def __getitem__(self, item):
-        return self.wrap(self.instance[item])
+        return self.wrap(self.instance[item], self.policy)
 
     def __repr__(self):
         return 'MotorProxy({})'.format(repr(self.instance))
@@ -1,40 +1,244 @@
-import copy
+import collections
+import time
 
+import bson.son
 import pymongo
+import tornado.gen
 
-from . import exceptions, expressions
+from . import aggregates, exceptions, expressions, identity
+from .advisor import advisor
+from .codec import Related
+from .router import READ_PREFERENCES, databases
+
+
+BATCH_SIZE = 100
+QUERY_PLAN_CACHE_SIZE = 1024
+
+RAW = 'raw'
+PASS = 'pass'
+SUFFIX = 'suffix'
+SERIALIZE = 'serialize'
+IDENTIFIER = 'identifier'
+VALUE = 'value'
+
+
+class QueryPlan(object):
+
+    def __init__(self, queryset, shape):
+        self.steps = []
+
+        for key, kind in shape:
+            if kind == RAW:
+                self.steps.append((key, RAW, None))
+            elif key.startswith('$'):
+                self.steps.append((key, PASS, None))
+            elif '__' in key:
+                key, suffix = key.split('__')
+                self.steps.append((key, SUFFIX, '${}'.format(suffix)))
+            elif key == '_id' and kind == VALUE:
+                field = queryset.get_field(key)
+                self.steps.append((key, IDENTIFIER, field))
+            elif kind == VALUE:
+                field = queryset.get_field(key)
+                self.steps.append((key, SERIALIZE, field))
+            else:
+                self.steps.append((key, PASS, None))
+
+    @staticmethod
+    def get_shape(query):
+        shape = []
+
+        for key, value in query.items():
+            if isinstance(value, expressions.Raw):
+                shape.append((key, RAW))
+            else:
+                shape.append((key, None if value is None else VALUE))
+
+        return tuple(shape)
+
+    async def bind(self, query):
+        result = {}
+
+        for (key, action, argument), value in zip(self.steps, query.values()):
+            if action == RAW:
+                value = value.query
+            elif action == SUFFIX:
+                value = {argument: value}
+            elif action == SERIALIZE:
+                value = await argument.db_serialize(value)
+            elif action == IDENTIFIER and isinstance(value, str):
+                try:
+                    value = argument.to_python(value)
+                except exceptions.ValidationError:
+                    pass
+
+            if isinstance(result.get(key), dict) and isinstance(value, dict):
+                result[key].update(value)
+            else:
+                result[key] = value
+
+        return result
+
+
+class QueryNode(object):
+
+    __slots__ = ('query', 'parent', 'merged', 'validated')
+
+    def __init__(self, query=None, parent=None):
+        self.query = {} if query is None else query
+        self.parent = parent
+        self.merged = None
+        self.validated = None
+
+    def extend(self, query):
+        if not query:
+            return self
+
+        return QueryNode(query, self)
+
+    def merge(self):
+        if self.merged is None:
+            if self.parent is None:
+                self.merged = self.query
+            else:
+                self.merged = dict(self.parent.merge())
+                self.merged.update(self.query)
+
+        return self.merged
+
+
+class ResultCache(object):
+
+    __slots__ = ('items',)
+
+    def __init__(self):
+        self.items = None
 
 
 class QuerySet(object):
 
     def __init__(self, model, query=None, offset=0, limit=0,
                  fields=None, sorts=None, collection=None, raw=False,
-                 raw_fields=None):
+                 raw_fields=None, prefetch_related=None, group=None,
+                 pipeline=None, batch_size=BATCH_SIZE, result_cache=None,
+                 deferred=None, read_preference=None):
+
+        if not isinstance(query, QueryNode):
+            query = QueryNode(query)
 
         self.model = model
-        self.query = query or {}
+        self.node = query
         self.offset = offset
         self.limit = limit
-        self.fields = fields or []
-        self._sorts = sorts or []
+        self.fields = tuple(fields or ())
+        self._sorts = tuple(sorts or ())
         self.collection = collection or self.model.Meta.collection
         self._raw = raw
-        self._raw_fields = raw_fields or []
+        self._raw_fields = tuple(raw_fields or ())
+        self._prefetch_related = tuple(prefetch_related or ())
+        self._group = group
+        self._pipeline = tuple(pipeline or ())
+        self._batch_size = batch_size
+        self._result_cache = result_cache
+        self._deferred = tuple(deferred or ())
+        self._read_preference = read_preference
+        self._loaded = self.get_loaded_fields()
 
         self._cursor = None
+        self._buffer = collections.deque()
+        self._results = None
 
     def __getattr__(self, attribute):
         return getattr(self.clone().cursor, attribute)
 
+    def __bool__(self):
+        return True
+
+    def __len__(self):
+        if not self.evaluated:
+            raise TypeError(
+                '{} is not evaluated, use count() instead'.format(
+                    self.__class__.__name__
+                )
+            )
+
+        return len(self._result_cache.items)
+
+    @property
+    def projection(self):
+        if self.fields:
+            return [name for name in self.fields if name not in self._deferred]
+        elif self._deferred:
+            return {name: False for name in self._deferred}
+
+        return None
+
+    def get_loaded_fields(self):
+        if self.fields:
+            fields = ('_id',) + self.fields
+        elif self._deferred:
+            fields = self.model.Meta.fields
+        else:
+            return None
+
+        return tuple(collections.OrderedDict.fromkeys(
+            name for name in fields
+            if name in self.model.Meta.fields and name not in self._deferred
+        ))
+
+    @property
+    def evaluated(self):
+        cache = self._result_cache
+        return cache is not None and cache.items is not None
+
+    @property
+    def query(self):
+        if self.node.validated is not None:
+            return self.node.validated
+
+        return self.node.merge()
+
+    @property
+    def aggregation(self):
+        return bool(self._group or self._pipeline)
+
+    @property
+    def reader(self):
+        mode = self._read_preference or databases.get_read_preference(
+            self.model.Meta.database
+        )
+
+        if mode is None or mode == 'primary':
+            return self.collection
+
+        key = (self.collection.name, mode)
+        readers = self.model.Meta.readers
+
+        try:
+            return readers[key]
+        except KeyError:
+            pass
+
+        reader = self.collection.with_options(
+            read_preference=READ_PREFERENCES[mode]
+        )
+        reader.model = self.model
+        readers[key] = reader
+
+        return reader
+
     @property
     def cursor(self):
-        if not self._cursor:
-            self._cursor = self.collection.find(
+        if not self._cursor and self.aggregation:
+            self._cursor = self.reader.aggregate(self.stages)
+        elif not self._cursor:
+            self._cursor = self.reader.find(
                 self.query,
-                self.fields or None,
+                self.projection,
                 skip=self.offset,
                 limit=self.limit,
-                sort=self.sorts
+                sort=self.sorts,
+                batch_size=self._batch_size
             )
 
         return self._cursor
@@ -58,73 +262,270 @@ class QuerySet(object):
 
         return sorts
 
+    @property
+    def stages(self):
+        stages = []
+
+        if self.query:
+            stages.append({'$match': self.query})
+
+        if self.sorts:
+            stages.append({'$sort': bson.son.SON(self.sorts)})
+
+        projection = self.projection
+
+        if isinstance(projection, list):
+            projection = {name: True for name in projection}
+
+        if projection:
+            stages.append({'$project': projection})
+
+        pipeline = list(self._pipeline)
+
+        if self._group:
+            index, keys, annotations = self._group
+            pipeline[index:index] = self.get_group_stages(keys, annotations)
+
+        stages.extend(pipeline)
+
+        if self.offset:
+            stages.append({'$skip': self.offset})
+
+        if self.limit:
+            stages.append({'$limit': self.limit})
+
+        return stages
+
+    @staticmethod
+    def get_group_stages(keys, annotations):
+        group = {'_id': {key: '${}'.format(key) for key in keys} or None}
+        project = {'_id': False}
+
+        for key in keys:
+            project[key] = '$_id.{}'.format(key)
+
+        for name, aggregate in annotations.items():
+            group[name] = aggregate.compile()
+            project[name] = True
+
+        return [{'$group': group}, {'$project': project}]
+
+    def get_field(self, name):
+        try:
+            return self.model.Meta.fields[name]
+        except KeyError:
+            raise exceptions.InvalidQuery(
+                '{} has not field {}'.format(self.model, name),
+                model=self.model,
+                field=name,
+            )
+
+    def get_aggregates(self, aggregates, named):
+        annotations = collections.OrderedDict()
+
+        for aggregate in aggregates:
+            annotations[aggregate.name] = aggregate
+
+        annotations.update(named)
+
+        for aggregate in annotations.values():
+            if aggregate.field is not None:
+                self.get_field(aggregate.field.split('.')[0])
+
+        return annotations
+
     async def __aiter__(self):
         clone = self.clone()
-        await clone.validate()
+
+        if self._result_cache is not None:
+            clone._results = collections.deque(await self.evaluate())
+        else:
+            await clone.validate()
+
         return clone
 
     async def __anext__(self):
-        if await self.cursor.fetch_next:
-            data = self.cursor.next_object()
+        if self._results is not None:
+            if self._results:
+                return self._results.popleft()
+
+            raise StopAsyncIteration()
+
+        if not self._buffer:
+            self._buffer.extend(await self.fetch())
 
-            if self._raw:
+        if self._buffer:
+            data = self._buffer.popleft()
+
+            if self._raw or self.aggregation:
                 return data
 
-            return await self.model.from_db(data, self._raw_fields)
+            return await self.model.from_db(
+                data, self._raw_fields, self._loaded, self._deferred
+            )
 
         raise StopAsyncIteration()
 
+    async def fetch(self):
+        recording = advisor.enabled and self._cursor is None
+        start = time.perf_counter()
+
+        documents = await self.cursor.to_list(self._batch_size)
+
+        if recording:
+            advisor.record(self, time.perf_counter() - start)
+
+        if self._prefetch_related and not (self._raw or self.aggregation):
+            await self.resolve_related(documents)
+
+        return documents
+
+    async def hydrate(self, documents):
+        if self._raw or self.aggregation:
+            return documents
+
+        instances = []
+
+        for data in documents:
+            instances.append(await self.model.from_db(
+                data, self._raw_fields, self._loaded, self._deferred
+            ))
+
+        return instances
+
+    async def batches(self, size=BATCH_SIZE, read_ahead=False):
+        clone = self.clone(batch_size=size)
+        await clone.validate()
+
+        documents = await clone.fetch()
+
+        while documents:
+            future = None
+
+            if read_ahead:
+                future = tornado.gen.convert_yielded(clone.fetch())
+
+            yield await clone.hydrate(documents)
+
+            if future is None:
+                documents = await clone.fetch()
+            else:
+                documents = await future
+
+    async def resolve_related(self, documents):
+        for name in self._prefetch_related:
+            if name in self._raw_fields:
+                continue
+            elif self._loaded is not None and name not in self._loaded:
+                continue
+
+            relation = self.model.Meta.fields[name].get_relation()
+            many = relation is not self.model.Meta.fields[name]
+            lookups = {}
+
+            for document in documents:
+                values = document.get(name)
+
+                if values is None:
+                    continue
+                elif not many:
+                    values = [values]
+
+                for value in values:
+                    try:
+                        lookups[value] = relation.get_lookup_value(value)
+                    except (exceptions.ValidationError, TypeError):
+                        continue
+
+            if not lookups:
+                continue
+
+            model = relation.get_related_model()
+            queryset = model.objects.filter(**{
+                '{}__in'.format(relation.to_field): list(lookups.values())
+            })
+            instances = {}
+
+            async for instance in queryset:
+                instances[getattr(instance, relation.to_field)] = instance
+
+            for document in documents:
+                values = document.get(name)
+
+                if values is None:
+                    continue
+                elif many:
+                    document[name] = Related((
+                        self.get_related_instance(instances, lookups, value)
+                        for value in values
+                    ), values)
+                else:
+                    document[name] = self.get_related_instance(
+                        instances, lookups, values
+                    )
+
+    @staticmethod
+    def get_related_instance(instances, lookups, value):
+        try:
+            return instances.get(lookups[value], value)
+        except (KeyError, TypeError):
+            return value
+
     def clone(self, **kwargs):
+        if kwargs and self._result_cache is not None:
+            kwargs.setdefault('result_cache', ResultCache())
+        else:
+            kwargs.setdefault('result_cache', self._result_cache)
+
         kwargs.setdefault('model', self.model)
-        kwargs.setdefault('query', copy.deepcopy(self.query))
+        kwargs.setdefault('query', self.node)
         kwargs.setdefault('offset', self.offset)
         kwargs.setdefault('limit', self.limit)
-        kwargs.setdefault('fields', copy.copy(self.fields))
-        kwargs.setdefault('sorts', copy.copy(self._sorts))
+        kwargs.setdefault('fields', self.fields)
+        kwargs.setdefault('sorts', self._sorts)
         kwargs.setdefault('collection', self.collection)
         kwargs.setdefault('raw', self._raw)
         kwargs.setdefault('raw_fields', self._raw_fields)
+        kwargs.setdefault('prefetch_related', self._prefetch_related)
+        kwargs.setdefault('group', self._group)
+        kwargs.setdefault('pipeline', self._pipeline)
+        kwargs.setdefault('batch_size', self._batch_size)
+        kwargs.setdefault('deferred', self._deferred)
+        kwargs.setdefault('read_preference', self._read_preference)
 
         return QuerySet(**kwargs)
 
-    async def validate(self):
-        query = {}
+    def get_query_plan(self, query):
+        shape = QueryPlan.get_shape(query)
+        plans = self.model.Meta.query_plans
 
-        if isinstance(self.query, expressions.Raw):
-            self.query = self.query.query
-            return
+        try:
+            return plans[shape]
+        except KeyError:
+            pass
 
-        for key, value in self.query.items():
-            if isinstance(value, expressions.Raw):
-                value = value.query
-            elif key.startswith('$'):
-                pass
-            elif '__' in key:
-                key, suffix = key.split('__')
-                value = {'${}'.format(suffix): value}
-            elif key != '_id' and value is not None:
-                try:
-                    field = self.model.Meta.fields[key]
-                except KeyError:
-                    raise exceptions.InvalidQuery(
-                        '{} has not field {}'.format(self.model, key),
-                        model=self.model,
-                        field=key,
-                    )
+        plan = QueryPlan(self, shape)
 
-                value = await field.db_serialize(value)
+        if len(plans) >= QUERY_PLAN_CACHE_SIZE:
+            plans.clear()
 
-            if isinstance(query.get(key), dict) and isinstance(value, dict):
-                query[key].update(value)
-            else:
-                query[key] = value
+        plans[shape] = plan
 
-        self.query = query
+        return plan
+
+    async def validate(self):
+        if self.node.validated is not None:
+            return
+
+        query = self.node.merge()
+
+        if isinstance(query, expressions.Raw):
+            self.node.validated = query.query
+        else:
+            self.node.validated = await self.get_query_plan(query).bind(query)
 
     def filter(self, **query):
-        clone = self.clone()
-        clone.query.update(query)
-        return clone
+        return self.clone(query=self.node.extend(query))
 
     def raw(self, query):
         if not isinstance(query, expressions.Raw):
@@ -133,60 +534,327 @@ class QuerySet(object):
         return self.clone(query=query)
 
     def order_by(self, *fields):
-        return self.clone(sorts=self._sorts + list(fields))
+        return self.clone(sorts=self._sorts + fields)
 
     def only(self, *fields):
-        return self.clone(fields=self.fields + list(fields))
+        return self.clone(fields=self.fields + fields)
+
+    def defer(self, *fields):
+        for name in fields:
+            self.get_field(name)
+
+            if name == '_id':
+                raise exceptions.InvalidQuery(
+                    '{} field _id cannot be deferred'.format(self.model),
+                    model=self.model,
+                    field=name,
+                )
+
+        return self.clone(deferred=self._deferred + fields)
 
     def values(self, *fields):
-        queryset = self.only(*fields)
-        queryset._raw = True
-        return queryset
+        return self.clone(fields=self.fields + fields, raw=True)
 
     def raw_fields(self, *fields):
-        return self.clone(raw_fields=self._raw_fields + list(fields))
+        return self.clone(raw_fields=self._raw_fields + fields)
+
+    def group_by(self, *fields):
+        for name in fields:
+            self.get_field(name)
+
+        index, keys, annotations = self._group or (
+            len(self._pipeline), [], collections.OrderedDict()
+        )
+
+        return self.clone(group=(index, keys + list(fields), annotations))
+
+    def annotate(self, *aggregates, **named):
+        index, keys, annotations = self._group or (
+            len(self._pipeline), [], collections.OrderedDict()
+        )
+
+        annotations = collections.OrderedDict(annotations)
+        annotations.update(self.get_aggregates(aggregates, named))
+
+        return self.clone(group=(index, keys, annotations))
+
+    def pipeline(self, stages):
+        return self.clone(pipeline=self._pipeline + tuple(stages))
+
+    async def aggregate(self, *aggregates, **named):
+        annotations = self.get_aggregates(aggregates, named)
+        stages = []
+
+        # The slice selects the documents to aggregate, so it has to run
+        # before the group stage rather than after it.
+        if self.offset:
+            stages.append({'$skip': self.offset})
+
+        if self.limit:
+            stages.append({'$limit': self.limit})
+
+        stages.extend(self.get_group_stages([], annotations))
+        clone = self.clone(offset=0, limit=0).pipeline(stages)
+
+        async for item in clone:
+            return item
+
+        return {name: None for name in annotations}
+
+    def prefetch_related(self, *fields):
+        if not fields:
+            fields = [
+                name for name, field in self.model.Meta.fields.items()
+                if field.get_relation() is not None
+            ]
+
+        for name in fields:
+            field = self.model.Meta.fields.get(name)
+
+            if field is None or field.get_relation() is None:
+                raise exceptions.InvalidQuery(
+                    '{} has not related field {}'.format(self.model, name),
+                    model=self.model,
+                    field=name,
+                )
+
+        return self.clone(
+            prefetch_related=self._prefetch_related + tuple(
+                name for name in fields if name not in self._prefetch_related
+            )
+        )
+
+    def read_from(self, mode):
+        if mode not in READ_PREFERENCES:
+            raise exceptions.InvalidQuery(
+                'Unknown read preference {}'.format(mode),
+                model=self.model,
+                field=None
+            )
+
+        return self.clone(read_preference=mode)
+
+    def cache(self):
+        return self.clone(result_cache=ResultCache())
+
+    async def evaluate(self):
+        if self.evaluated:
+            return self._result_cache.items
+
+        items = []
+
+        async for batch in self.batches(self._batch_size):
+            items.extend(batch)
+
+        if self._result_cache is not None:
+            self._result_cache.items = items
+
+        return items
+
+    async def exists(self):
+        if self.evaluated:
+            return bool(self._result_cache.items)
+
+        return bool(await self.clone(limit=1).count())
 
     async def count(self):
+        if self.evaluated:
+            return len(self._result_cache.items)
+
         clone = self.clone()
         await clone.validate()
+
+        if clone.aggregation:
+            stages = clone.stages + clone.get_group_stages(
+                [], {'count': aggregates.Count()}
+            )
+            result = await clone.reader.aggregate(stages).to_list(1)
+            return result[0]['count'] if result else 0
+
         return await clone.cursor.count(True)
 
+    async def estimated_count(self):
+        if self.query or self.aggregation or self.offset or self.limit:
+            return await self.count()
+
+        return await self.reader.count()
+
+    async def explain(self):
+        clone = self.clone()
+        await clone.validate()
+
+        if clone.aggregation:
+            result = await clone.collection.database.command(
+                'explain',
+                {
+                    'aggregate': clone.collection.name,
+                    'pipeline': clone.stages,
+                    'cursor': {}
+                },
+                verbosity='executionStats'
+            )
+        else:
+            result = await clone.cursor.explain()
+
+        return self.get_explanation(result)
+
+    @staticmethod
+    def get_explanation(result):
+        for stage in result.get('stages', ()):
+            if '$cursor' in stage:
+                result = stage['$cursor']
+                break
+
+        planner = result.get('queryPlanner', {})
+        stats = result.get('executionStats', {})
+
+        return {
+            'winning_plan': planner.get('winningPlan'),
+            'keys_examined': stats.get('totalKeysExamined'),
+            'docs_examined': stats.get('totalDocsExamined')
+        }
+
+    def check_unsliced(self, action):
+        if self.offset or self.limit:
+            raise exceptions.InvalidQuery(
+                'Cannot {} a sliced {}'.format(
+                    action, self.__class__.__name__
+                ),
+                model=self.model,
+                field=None,
+                query=self.query
+            )
+
+    async def update(self, **values):
+        self.check_unsliced('update')
+
+        update = {}
+
+        for key, value in values.items():
+            name, __, operator = key.partition('__')
+            field = self.get_field(name)
+
+            if not operator:
+                try:
+                    value = await field.validate(value)
+                except exceptions.ValidationError as e:
+                    raise exceptions.ValidationError({name: e.error})
+
+                if value is None:
+                    update.setdefault('$unset', {})[name] = ''
+                    continue
+
+                operator = 'set'
+                value = await field.db_serialize(value)
+
+            update.setdefault('${}'.format(operator), {})[name] = value
+
+        if not update:
+            return {'matched': 0, 'modified': 0}
+
+        clone = self.clone()
+        await clone.validate()
+
+        try:
+            result = await clone.collection.update_many(clone.query, update)
+        finally:
+            self.model.invalidate_all()
+
+        return {
+            'matched': result.matched_count,
+            'modified': result.modified_count
+        }
+
+    async def delete(self):
+        self.check_unsliced('delete')
+
+        clone = self.clone()
+        await clone.validate()
+
+        try:
+            result = await clone.collection.delete_many(clone.query)
+        finally:
+            self.model.invalidate_all()
+
+        return result.deleted_count
+
+    def get_lookup_field(self):
+        query = self.node.merge()
+
+        if not isinstance(query, dict) or len(query) != 1:
+            return None
+        elif self._raw or self.aggregation or self.offset:
+            return None
+        elif self._loaded is not None or self._raw_fields:
+            return None
+
+        return next(iter(query))
+
     async def get(self, **query):
-        clone = self.filter(**query)
-        clone.limit = 1
+        clone = self.clone(query=self.node.extend(query), limit=1)
+        identity_map = identity.get_identity_map()
+        cache = self.model.Meta.cache
+        name = clone.get_lookup_field()
+
+        if name == '_id' and identity_map is not None:
+            await clone.validate()
+            instance = identity_map.get(clone.model, clone.query['_id'])
+
+            if instance is not None:
+                return instance
+
+        if (cache is not None and name is not None and cache.is_cached(name)
+                and not self._prefetch_related):
+            return await clone.get_cached(cache, name)
 
         async for item in clone:
             return item
 
         raise clone.model.DoesNotExist()
 
+    async def get_cached(self, cache, name):
+        await self.validate()
+        value = self.query[name]
+        data = cache.get(name, value)
+
+        if data is None:
+            async for data in self.clone(raw=True):
+                cache.set(data)
+                break
+            else:
+                raise self.model.DoesNotExist()
+
+        return await self.model.from_db(data)
+
     async def first(self):
-        clone = self.clone()
-        clone._sorts.append('_id')
-        return await clone.get()
+        return await self.clone(sorts=self._sorts + ('_id',)).get()
 
     async def last(self):
-        clone = self.clone()
-        clone._sorts.append('-_id')
-        return await clone.get()
+        return await self.clone(sorts=self._sorts + ('-_id',)).get()
+
+    async def get_evaluated(self, index):
+        try:
+            return self._result_cache.items[index]
+        except IndexError:
+            raise self.model.DoesNotExist()
 
     def all(self):
         return self.filter()
 
     def __getitem__(self, item):
-        clone = self.clone()
+        offset, limit = self.offset, self.limit
 
         if isinstance(item, slice):
             if item.start is not None and item.stop is not None:
-                clone.offset = item.start
-                clone.limit = item.stop - item.start
+                offset = item.start
+                limit = item.stop - item.start
             elif item.start is not None:
-                clone.offset = item.start
+                offset = item.start
             elif item.stop is not None:
-                clone.limit = item.stop
+                limit = item.stop
+        elif self.evaluated:
+            return self.get_evaluated(item)
         else:
-            clone.offset = item
-            clone.limit = 1
-            return clone.get()
+            return self.clone(offset=item, limit=1).get()
 
-        return clone
+        return self.clone(offset=offset, limit=limit)
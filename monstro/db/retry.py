@@ -0,0 +1,175 @@
+import random
+import time
+
+import pymongo.errors
+import tornado.concurrent
+import tornado.gen
+
+from . import exceptions
+
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half-open'
+
+
+class CircuitBreaker(object):
+
+    def __init__(self, threshold=5, timeout=30.0):
+        self.threshold = threshold
+        self.timeout = timeout
+        self.state = CLOSED
+        self.failures = 0
+        self.opened = None
+        self.probing = False
+        self.trips = 0
+        self.rejected = 0
+
+    def allow(self):
+        if self.state == OPEN:
+            if time.monotonic() - self.opened < self.timeout:
+                self.rejected += 1
+                return False
+
+            self.state = HALF_OPEN
+
+        if self.state == HALF_OPEN:
+            if self.probing:
+                self.rejected += 1
+                return False
+
+            self.probing = True
+
+        return True
+
+    def release(self):
+        self.probing = False
+
+    def success(self):
+        self.failures = 0
+        self.state = CLOSED
+        self.probing = False
+
+    def failure(self):
+        self.failures += 1
+        self.probing = False
+
+        if self.state == HALF_OPEN or self.failures >= self.threshold:
+            if self.state != OPEN:
+                self.trips += 1
+
+            self.state = OPEN
+            self.opened = time.monotonic()
+
+
+class RetryPolicy(object):
+
+    idempotent = frozenset((
+        'find_one', 'count', 'count_documents', 'estimated_document_count',
+        'distinct', 'index_information', 'create_index', 'create_indexes',
+        'drop_index', 'replace_one', 'delete_one', 'delete_many', 'remove'
+    ))
+
+    def __init__(self, alias='default', *, attempts=3, backoff=0.05,
+                 max_backoff=1.0, failure_threshold=5, reset_timeout=30.0):
+
+        self.alias = alias
+        self.attempts = attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.breaker = CircuitBreaker(failure_threshold, reset_timeout)
+        self.retries = 0
+
+    def get_metrics(self):
+        return {
+            'state': self.breaker.state,
+            'failures': self.breaker.failures,
+            'trips': self.breaker.trips,
+            'rejected': self.breaker.rejected,
+            'retries': self.retries
+        }
+
+    def get_delay(self, attempt):
+        return random.uniform(
+            0, min(self.max_backoff, self.backoff * 2 ** attempt)
+        )
+
+    def check(self):
+        if not self.breaker.allow():
+            raise exceptions.DatabaseUnavailable(
+                'Database "{}" is unavailable, circuit is open'.format(
+                    self.alias
+                ),
+                alias=self.alias
+            )
+
+    def track(self, future):
+        exception = future.exception()
+
+        if isinstance(exception, pymongo.errors.ConnectionFailure):
+            self.breaker.failure()
+        elif exception is None or isinstance(
+                exception, pymongo.errors.PyMongoError):
+            self.breaker.success()
+        else:
+            self.breaker.release()
+
+    def call(self, function, name, args, kwargs, restart=None):
+        self.check()
+
+        try:
+            result = function(*args, **kwargs)
+        except pymongo.errors.ConnectionFailure:
+            self.breaker.failure()
+            raise
+        except Exception:
+            self.breaker.release()
+            raise
+
+        if not tornado.concurrent.is_future(result):
+            self.breaker.release()
+            return result
+        elif self.attempts > 1 and (
+                name in self.idempotent or restart is not None):
+            return tornado.gen.convert_yielded(
+                self.retry(function, args, kwargs, result, restart)
+            )
+
+        result.add_done_callback(self.track)
+
+        return result
+
+    async def retry(self, function, args, kwargs, future, restart=None):
+        attempt = 1
+
+        while True:
+            try:
+                result = await future
+            except pymongo.errors.AutoReconnect:
+                self.breaker.failure()
+
+                if attempt >= self.attempts:
+                    raise
+
+                await tornado.gen.sleep(self.get_delay(attempt))
+
+                attempt += 1
+                self.retries += 1
+                self.check()
+
+                if restart is not None:
+                    function = restart()
+
+                future = function(*args, **kwargs)
+            except pymongo.errors.ConnectionFailure:
+                self.breaker.failure()
+                raise
+            except pymongo.errors.PyMongoError:
+                self.breaker.success()
+                raise
+            except Exception:
+                self.breaker.release()
+                raise
+            else:
+                self.breaker.success()
+                return result
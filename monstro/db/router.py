@@ -1,11 +1,23 @@
 import os
 
 import motor
+import pymongo
+import tornado.gen
 
 from monstro.conf import settings
 from monstro.core.constants import TEST_ENVIRONMENT_VARIABLE
+from monstro.core.exceptions import ImproperlyConfigured
 
-from . import proxy
+from . import pool, proxy, retry
+
+
+READ_PREFERENCES = {
+    'primary': pymongo.ReadPreference.PRIMARY,
+    'primaryPreferred': pymongo.ReadPreference.PRIMARY_PREFERRED,
+    'secondary': pymongo.ReadPreference.SECONDARY,
+    'secondaryPreferred': pymongo.ReadPreference.SECONDARY_PREFERRED,
+    'nearest': pymongo.ReadPreference.NEAREST
+}
 
 
 class Router(object):
@@ -14,13 +26,24 @@ class Router(object):
         test = TEST_ENVIRONMENT_VARIABLE in os.environ
 
         self.__databases = {}
+        self.__read_preferences = {}
+        self.__pools = {}
+        self.__pool_sizes = {}
+        self.__policies = {}
+
+        proxy.slow_queries.threshold = getattr(
+            settings, 'slow_query_threshold', None
+        )
 
         for database in settings.databases:
+            metrics = pool.get_pool_metrics()
+            policy = self.get_retry_policy(database)
             client = proxy.MotorProxy(
                 motor.MotorClient(
                     database['uri'],
-                    **database.get('options')
-                )
+                    **pool.get_client_options(database, metrics)
+                ),
+                policy=policy
             )
 
             name = database['name']
@@ -28,18 +51,82 @@ class Router(object):
             if test:
                 name = 'test_{}'.format(name)
 
-            self.set(database['alias'], client[name])
+            self.set(
+                database['alias'],
+                client[name],
+                database.get('read_preference'),
+                policy
+            )
+
+            self.__pools[database['alias']] = metrics
+            self.__pool_sizes[database['alias']] = database.get(
+                'min_pool_size'
+            )
+
+    @staticmethod
+    def get_retry_policy(database):
+        options = database.get('retry')
+
+        if not options:
+            return None
+
+        try:
+            return retry.RetryPolicy(database['alias'], **options)
+        except TypeError as e:
+            raise ImproperlyConfigured(
+                'Invalid retry options for database "{}": {}'.format(
+                    database['alias'], e
+                )
+            )
 
     def get(self, alias='default'):
         return self.__databases[alias]
 
-    def set(self, alias, database):
+    def get_retry_metrics(self, alias='default'):
+        policy = self.__policies.get(alias)
+
+        if policy is None:
+            return None
+
+        return policy.get_metrics()
+
+    def get_pool_metrics(self, alias='default'):
+        metrics = self.__pools.get(alias)
+
+        if metrics is None:
+            return None
+
+        return metrics.get()
+
+    async def warm_up(self):
+        for alias, database in self.__databases.items():
+            size = self.__pool_sizes.get(alias) or 1
+
+            await tornado.gen.multi(
+                [database.command('ping') for __ in range(size)]
+            )
+
+    def get_read_preference(self, alias='default'):
+        return self.__read_preferences.get(alias)
+
+    def set(self, alias, database, read_preference=None, policy=None):
         assert isinstance(database, (motor.MotorDatabase, proxy.MotorProxy))
 
+        if read_preference and read_preference not in READ_PREFERENCES:
+            raise ImproperlyConfigured(
+                'Unknown read preference "{}" for database "{}".'.format(
+                    read_preference, alias
+                )
+            )
+
         if isinstance(database, motor.MotorDatabase):
-            database = proxy.MotorProxy(database)
+            database = proxy.MotorProxy(database, policy=policy)
+        elif database.policy is None and policy is not None:
+            database.policy = policy
 
         self.__databases[alias] = database
+        self.__policies[alias] = database.policy
+        self.__read_preferences[alias] = read_preference
 
 
 databases = Router()
@@ -0,0 +1,76 @@
+import re
+import uuid
+
+import pymongo
+
+from monstro.db import advisor, fields, model
+import monstro.testing
+
+
+class QueryShapeTest(monstro.testing.AsyncTestCase):
+
+    def test_from_query(self):
+        shape = advisor.QueryShape.from_query(None, {
+            'status': 'active',
+            'kind': {'$in': [1, 2]},
+            'age': {'$gt': 18},
+            'name': re.compile('^a'),
+            '$or': [{'title': {'$regex': 'a'}}, {'body': {'$regex': 'a'}}]
+        }, [('created', pymongo.DESCENDING)])
+
+        self.assertEqual(('kind', 'status'), shape.equality)
+        self.assertEqual((('created', pymongo.DESCENDING),), shape.sort)
+        self.assertEqual(('age', 'body', 'name', 'title'), shape.range)
+
+    def test_get_keys(self):
+        shape = advisor.QueryShape(
+            None, ('status',), (('created', -1),), ('age',)
+        )
+
+        self.assertEqual(
+            [('status', 1), ('created', -1), ('age', 1)], shape.get_keys()
+        )
+
+    def test_is_covered_by(self):
+        shape = advisor.QueryShape(None, ('status',), (('created', -1),), ())
+
+        self.assertTrue(shape.is_covered_by([('status', 1), ('created', -1)]))
+        self.assertTrue(shape.is_covered_by([('status', 1), ('created', 1)]))
+        self.assertFalse(shape.is_covered_by([('created', -1)]))
+        self.assertFalse(shape.is_covered_by([('status', 1)]))
+
+
+class IndexAdvisorTest(monstro.testing.AsyncTestCase):
+
+    class Model(model.Model):
+        name = fields.String()
+        created = fields.Integer()
+
+        class Meta:
+            collection = uuid.uuid4().hex
+
+    def setUp(self):
+        super().setUp()
+        self.advisor = advisor.IndexAdvisor(True)
+
+    async def test_report(self):
+        queryset = self.Model.objects.filter(name='name').order_by('-created')
+        await queryset.validate()
+
+        self.advisor.record(queryset, 0.5)
+        self.advisor.record(queryset, 1.5)
+
+        report = await self.advisor.report()
+
+        self.assertEqual(1, len(report))
+        self.assertEqual(2, report[0]['count'])
+        self.assertEqual(1.0, report[0]['average'])
+        self.assertFalse(report[0]['covered'])
+        self.assertEqual(
+            'name_1_created_-1', report[0]['suggestion'].name
+        )
+
+    async def test_record__empty(self):
+        self.advisor.record(self.Model.objects.all(), 1)
+
+        self.assertEqual({}, self.advisor.shapes)
@@ -0,0 +1,34 @@
+import unittest
+
+from monstro.db import Sum, Avg, Min, Max, Count
+
+
+class AggregateTest(unittest.TestCase):
+
+    def test_name(self):
+        self.assertEqual('price__sum', Sum('price').name)
+        self.assertEqual('price__avg', Avg('price').name)
+        self.assertEqual('price__min', Min('price').name)
+        self.assertEqual('price__max', Max('price').name)
+
+    def test_compile(self):
+        self.assertEqual({'$sum': '$price'}, Sum('price').compile())
+        self.assertEqual({'$avg': '$price'}, Avg('price').compile())
+
+    def test_field_required(self):
+        for aggregate in (Sum, Avg, Min, Max):
+            with self.assertRaises(TypeError):
+                aggregate()
+
+
+class CountTest(unittest.TestCase):
+
+    def test_name(self):
+        self.assertEqual('count', Count().name)
+        self.assertEqual('price__count', Count('price').name)
+
+    def test_compile(self):
+        self.assertEqual({'$sum': 1}, Count().compile())
+
+    def test_compile__field(self):
+        self.assertIn('$cond', Count('price').compile()['$sum'])
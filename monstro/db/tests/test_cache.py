@@ -0,0 +1,115 @@
+import uuid
+from unittest import mock
+
+from monstro.db import cache, fields, model
+import monstro.testing
+
+
+class DocumentCacheTest(monstro.testing.AsyncTestCase):
+
+    def test_get(self):
+        documents = cache.DocumentCache(fields=('email',))
+        documents.set({'_id': 1, 'email': 'a@b.c', 'tags': ['a']})
+
+        data = documents.get('_id', 1)
+        data['tags'].append('b')
+
+        self.assertEqual(['a'], documents.get('email', 'a@b.c')['tags'])
+        self.assertIsNone(documents.get('_id', 2))
+        self.assertEqual(
+            {
+                'size': 1, 'hits': 2, 'misses': 1,
+                'evictions': 0, 'expirations': 0
+            },
+            documents.get_stats()
+        )
+
+    def test_size(self):
+        documents = cache.DocumentCache(size=2, fields=('email',))
+
+        for _id in range(3):
+            documents.set({'_id': _id, 'email': str(_id)})
+
+        self.assertEqual(2, len(documents))
+        self.assertIsNone(documents.get('email', '0'))
+        self.assertEqual(2, documents.get('email', '2')['_id'])
+        self.assertEqual(1, documents.get_stats()['evictions'])
+
+    def test_ttl(self):
+        documents = cache.DocumentCache(ttl=10)
+
+        with mock.patch('time.monotonic', return_value=0):
+            documents.set({'_id': 1})
+
+        with mock.patch('time.monotonic', return_value=11):
+            self.assertIsNone(documents.get('_id', 1))
+
+        self.assertEqual(1, documents.get_stats()['expirations'])
+
+    def test_discard(self):
+        documents = cache.DocumentCache(fields=('email',))
+        documents.set({'_id': 1, 'email': 'a@b.c'})
+
+        documents.discard(1)
+
+        self.assertIsNone(documents.get('email', 'a@b.c'))
+        self.assertEqual({}, documents.aliases)
+
+
+class ModelCacheTest(monstro.testing.AsyncTestCase):
+
+    class Model(model.Model):
+        name = fields.String()
+
+        class Meta:
+            collection = uuid.uuid4().hex
+            cache = cache.DocumentCache(fields=('name',))
+
+    def setUp(self):
+        super().setUp()
+        self.Model.Meta.cache.clear()
+
+    async def test_get(self):
+        instance = await self.Model.objects.create(name='name')
+
+        first = await self.Model.objects.get(_id=instance._id)
+        second = await self.Model.objects.get(name='name')
+
+        self.assertEqual(first._id, second._id)
+        self.assertEqual(1, self.Model.Meta.cache.get_stats()['hits'])
+
+    async def test_get__using(self):
+        name = uuid.uuid4().hex
+        instance = await self.Model.using(collection=name).objects.create(
+            name='name'
+        )
+
+        await self.Model.using(collection=name).objects.get(_id=instance._id)
+        bound = self.Model.using(collection=name)
+        await bound.objects.get(_id=instance._id)
+
+        self.assertIs(bound, self.Model.using(collection=name))
+        self.assertEqual(1, bound.Meta.cache.get_stats()['hits'])
+
+    async def test_get__does_not_exist(self):
+        with self.assertRaises(self.Model.DoesNotExist):
+            await self.Model.objects.get(name='none')
+
+    async def test_save(self):
+        instance = await self.Model.objects.create(name='name')
+        await self.Model.objects.get(_id=instance._id)
+
+        await instance.update(name='updated')
+
+        self.assertEqual(0, len(self.Model.Meta.cache))
+        self.assertEqual(
+            'updated', (await self.Model.objects.get(_id=instance._id)).name
+        )
+
+    async def test_queryset_update(self):
+        instance = await self.Model.objects.create(name='name')
+        await self.Model.objects.get(_id=instance._id)
+
+        await self.Model.objects.filter(name='name').update(name='updated')
+
+        self.assertEqual(0, len(self.Model.Meta.cache))
@@ -0,0 +1,51 @@
+import datetime
+
+from monstro.db import codec, fields, model
+import monstro.testing
+
+
+class CodecTest(monstro.testing.AsyncTestCase):
+
+    class Model(model.Model):
+        name = fields.String()
+        created = fields.DateTime(auto_now_on_create=True)
+        related = fields.ForeignKey(to='self', required=False)
+
+    def test_modes(self):
+        steps = {step[0]: step[2:] for step in self.Model.Meta.codec.steps}
+
+        self.assertEqual(
+            (codec.SKIP, codec.SKIP, codec.SYNC, codec.SYNC), steps['name']
+        )
+        self.assertEqual(
+            (codec.SYNC, codec.SYNC, codec.SYNC, codec.SYNC), steps['created']
+        )
+        self.assertEqual(
+            (codec.SKIP, codec.SKIP, codec.ASYNC, codec.ASYNC),
+            steps['related']
+        )
+
+    async def test_dump(self):
+        instance = self.Model(name='name')
+
+        data = await self.Model.Meta.codec.dump(instance, created=True)
+
+        self.assertEqual('name', data['name'])
+        self.assertIsInstance(data['created'], datetime.datetime)
+        self.assertNotIn('related', data)
+
+    async def test_dump__validation_error(self):
+        instance = self.Model(name=1)
+
+        with self.assertRaises(model.ValidationError) as context:
+            await self.Model.Meta.codec.dump(instance)
+
+        self.assertIn('name', context.exception.error)
+
+    async def test_load(self):
+        instance = await self.Model.Meta.codec.load(
+            self.Model, {'name': 'name', 'created': 'invalid'}, ('created',)
+        )
+
+        self.assertEqual('name', instance.name)
+        self.assertEqual('invalid', instance.created)
@@ -0,0 +1,71 @@
+import uuid
+
+from monstro.db import fields, identity, model
+import monstro.testing
+
+
+class IdentityMapTest(monstro.testing.AsyncTestCase):
+
+    class Model(model.Model):
+        name = fields.String()
+
+        class Meta:
+            collection = uuid.uuid4().hex
+
+    def test_add(self):
+        identity_map = identity.IdentityMap()
+        instance = self.Model(_id=1, name='name')
+
+        identity_map.add(instance)
+
+        self.assertIs(instance, identity_map.get(self.Model, 1))
+        self.assertIsNone(identity_map.get(self.Model, 2))
+        self.assertIsNone(identity_map.get(self.Model, {'$gt': 1}))
+
+        identity_map.discard(instance)
+
+        self.assertIsNone(identity_map.get(self.Model, 1))
+
+    def test_discard_model(self):
+        identity_map = identity.IdentityMap()
+        identity_map.add(self.Model(_id=1))
+        identity_map.add(self.Model(_id=2))
+
+        identity_map.discard_model(self.Model)
+
+        self.assertEqual(0, len(identity_map))
+
+    def test_scope(self):
+        identity_map = identity.IdentityMap()
+
+        self.assertIsNone(identity.get_identity_map())
+
+        with identity.scope(identity_map):
+            self.assertIs(identity_map, identity.get_identity_map())
+
+        self.assertIsNone(identity.get_identity_map())
+
+    def test_get(self):
+        instance = self.run_sync(self.Model.objects.create, name='name')
+        identity_map = identity.IdentityMap()
+
+        with identity.scope(identity_map):
+            first = self.run_sync(self.Model.objects.get, _id=instance._id)
+            second = self.run_sync(
+                self.Model.objects.get, _id=str(instance._id)
+            )
+
+        self.assertIs(first, second)
+        self.assertEqual(1, len(identity_map))
+
+    def test_save(self):
+        instance = self.run_sync(self.Model.objects.create, name='name')
+        identity_map = identity.IdentityMap()
+
+        with identity.scope(identity_map):
+            first = self.run_sync(self.Model.objects.get, _id=instance._id)
+            self.run_sync(first.update, name='updated')
+            second = self.run_sync(self.Model.objects.get, _id=instance._id)
+
+        self.assertIsNot(first, second)
+        self.assertEqual('updated', second.name)
@@ -0,0 +1,128 @@
+import uuid
+
+import pymongo
+
+from monstro.db import fields, indexes, model
+import monstro.testing
+
+
+class IndexTest(monstro.testing.AsyncTestCase):
+
+    def test_keys(self):
+        index = indexes.Index('status', '-created')
+
+        self.assertEqual(
+            (('status', pymongo.ASCENDING), ('created', pymongo.DESCENDING)),
+            index.keys
+        )
+        self.assertEqual('status_1_created_-1', index.name)
+
+    def test_options(self):
+        index = indexes.Index(
+            'created', partial={'status': 'active'}, ttl=3600
+        )
+
+        self.assertEqual(
+            {
+                'unique': False,
+                'sparse': False,
+                'partialFilterExpression': {'status': 'active'},
+                'expireAfterSeconds': 3600
+            },
+            index.options
+        )
+
+    def test_matches(self):
+        index = indexes.Index('name', unique=True)
+
+        self.assertTrue(index.matches({'key': {'name': 1}, 'unique': True}))
+        self.assertFalse(index.matches({'key': {'name': 1}}))
+        self.assertFalse(index.matches({'key': {'name': -1}, 'unique': True}))
+
+    def test_get_indexes(self):
+
+        class CustomModel(model.Model):
+            key = fields.String(unique=True)
+            created = fields.DateTime()
+
+            class Meta:
+                indexes = [indexes.Index('key', '-created')]
+
+        self.assertEqual(
+            ['key_1', 'key_1_created_-1'],
+            [index.name for index in CustomModel.Meta.indexes]
+        )
+
+    async def test_sync(self):
+
+        class CustomModel(model.Model):
+            key = fields.String(unique=True)
+            created = fields.DateTime()
+
+            class Meta:
+                collection = uuid.uuid4().hex
+                indexes = [
+                    indexes.Index('key', '-created'),
+                    indexes.Index('created', ttl=60)
+                ]
+
+        result = await CustomModel.prepare()
+
+        self.assertEqual(
+            ['key_1', 'key_1_created_-1', 'created_1'], result['created']
+        )
+        self.assertEqual({'created': [], 'dropped': [], 'stale': []},
+                         await CustomModel.prepare())
+
+        information = await CustomModel.Meta.collection.index_information()
+
+        self.assertEqual(60, information['created_1']['expireAfterSeconds'])
+
+    async def test_sync__stale(self):
+        class CustomModel(model.Model):
+            key = fields.String(index=pymongo.ASCENDING)
+
+            class Meta:
+                collection = uuid.uuid4().hex
+
+        await CustomModel.Meta.collection.create_index('legacy')
+
+        result = await CustomModel.prepare()
+
+        self.assertEqual(['legacy_1'], result['stale'])
+
+        result = await CustomModel.prepare(drop=True)
+
+        self.assertEqual(['legacy_1'], result['dropped'])
+
+    async def test_sync__renamed(self):
+        class CustomModel(model.Model):
+            key = fields.String(index=pymongo.ASCENDING)
+
+            class Meta:
+                collection = uuid.uuid4().hex
+
+        await CustomModel.Meta.collection.create_index(
+            'key', name='custom', sparse=True
+        )
+
+        self.assertEqual({'created': [], 'dropped': [], 'stale': []},
+                         await CustomModel.prepare())
+
+    async def test_sync__renamed_conflict(self):
+        class CustomModel(model.Model):
+            key = fields.String(unique=True)
+
+            class Meta:
+                collection = uuid.uuid4().hex
+
+        await CustomModel.Meta.collection.create_index('key', name='custom')
+
+        result = await CustomModel.prepare()
+
+        self.assertEqual(['custom'], result['stale'])
+
+        result = await CustomModel.prepare(drop=True)
+
+        self.assertEqual(['custom'], result['dropped'])
+        self.assertEqual(['key_1'], result['created'])
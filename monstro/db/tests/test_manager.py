@@ -4,6 +4,7 @@ import random
 import monstro.testing
 
 from monstro import db
+from monstro.db.exceptions import InvalidQuery
 
 
 class ManagerTest(monstro.testing.AsyncTestCase):
@@ -13,6 +14,7 @@ class ManagerTest(monstro.testing.AsyncTestCase):
 
         class Test(db.Model):
             name = db.String()
+            slug = db.String(unique=True, required=False)
 
             class Meta:
                 collection = uuid.uuid4().hex
@@ -39,3 +41,92 @@ class ManagerTest(monstro.testing.AsyncTestCase):
         count = await self.model.objects.filter(name=instance.name).count()
 
         self.assertEqual(1, count)
+
+    async def test_bulk_create(self):
+        instances = await self.model.objects.bulk_create(
+            [self.model(name='bulk{}'.format(i)) for i in range(5)],
+            batch_size=2
+        )
+        count = await self.model.objects.filter(name__regex='^bulk').count()
+
+        self.assertEqual(5, count)
+        self.assertTrue(all(instance._id for instance in instances))
+
+    async def test_bulk_create__validation_error(self):
+        with self.assertRaises(self.model.ValidationError) as context:
+            await self.model.objects.bulk_create(
+                [self.model(name='bulk'), self.model()]
+            )
+
+        self.assertEqual([1], list(context.exception.error))
+        self.assertIn('name', context.exception.error[1])
+
+    async def test_bulk_create__unique(self):
+        await self.model.prepare()
+
+        instances = [
+            self.model(name='first', slug='slug'),
+            self.model(name='second', slug='slug'),
+            self.model(name='third', slug='other'),
+        ]
+
+        with self.assertRaises(self.model.ValidationError) as context:
+            await self.model.objects.bulk_create(instances)
+
+        self.assertEqual(
+            {1: {'slug': self.model.Meta.errors['unique']}},
+            context.exception.error
+        )
+        self.assertTrue(instances[0]._id)
+        self.assertFalse(instances[1]._id)
+        self.assertTrue(instances[2]._id)
+
+    async def test_bulk_update(self):
+        instances = []
+
+        async for instance in self.model.objects.filter():
+            instance.name = 'updated'
+            instances.append(instance)
+
+        matched = await self.model.objects.bulk_update(
+            instances, fields=['name'], batch_size=5
+        )
+        count = await self.model.objects.filter(name='updated').count()
+
+        self.assertEqual(self.number, matched)
+        self.assertEqual(self.number, count)
+
+    async def test_bulk_update__only(self):
+        instance = await self.model.objects.get(name='test0')
+        await instance.update(slug='slug')
+
+        instances = []
+
+        async for instance in self.model.objects.only('name'):
+            instance.name = 'updated'
+            instances.append(instance)
+
+        await self.model.objects.bulk_update(instances)
+        instance = await self.model.objects.get(slug='slug')
+
+        self.assertEqual('updated', instance.name)
+        self.assertEqual(set(), instances[0]._dirty)
+
+    async def test_bulk_update__not_loaded(self):
+        instance = await self.model.objects.only('name').first()
+
+        with self.assertRaises(InvalidQuery):
+            await self.model.objects.bulk_update([instance], fields=['slug'])
+
+    async def test_bulk_update__keeps_dirty(self):
+        instance = await self.model.objects.get(name='test0')
+        instance.name = 'updated'
+        instance.slug = 'slug'
+
+        await self.model.objects.bulk_update([instance], fields=['name'])
+        await instance.save()
+
+        instance = await self.model.objects.get(_id=instance._id)
+
+        self.assertEqual('updated', instance.name)
+        self.assertEqual('slug', instance.slug)
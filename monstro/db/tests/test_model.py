@@ -1,5 +1,7 @@
 import datetime
 import uuid
+import weakref
+from unittest import mock
 
 from monstro.forms.exceptions import ValidationError
 from monstro.db import fields, model, manager, proxy, databases
@@ -43,6 +45,37 @@ class ModelTest(monstro.testing.AsyncTestCase):
         with self.assertRaises(AttributeError):
             model.Model().none()
 
+    def test_setattr__custom_attribute(self):
+        class CustomModel(model.Model):
+            string = fields.String()
+
+        instance = CustomModel(string='string')
+        instance.custom = 'custom'
+
+        self.assertEqual('custom', instance.custom)
+        self.assertNotIn('string', instance.__dict__)
+
+    def test_weakref(self):
+        class CustomModel(model.Model):
+            string = fields.String()
+
+        class ChildModel(CustomModel):
+            pass
+
+        for klass in (CustomModel, ChildModel):
+            instance = klass(string='string')
+
+            self.assertIs(instance, weakref.ref(instance)())
+
+    def test_setattr__slots(self):
+        class CustomModel(model.Model):
+            __slots__ = ()
+
+            string = fields.String()
+
+        with self.assertRaises(AttributeError):
+            CustomModel().custom = 'custom'
+
     def test_getattr__default_list(self):
         class CustomModel(model.Model):
             array = fields.Array(default=list)
@@ -347,3 +380,157 @@ class ModelTest(monstro.testing.AsyncTestCase):
 
         self.assertIsInstance(instance.string, str)
         self.assertIs(instance.integer, None)
+
+    async def test_from_db__lazy(self):
+        class CustomModel(model.Model):
+            integer = fields.Integer()
+            json = fields.JSON()
+
+            class Meta:
+                collection = uuid.uuid4().hex
+                lazy = True
+
+        instance = await CustomModel.from_db(
+            {'integer': 'j', 'json': '{"key": "value"}'}
+        )
+
+        self.assertEqual(
+            {'integer': 'j', 'json': '{"key": "value"}'}, instance._pending
+        )
+        self.assertEqual({'key': 'value'}, instance.json)
+        self.assertIs(instance.integer, None)
+        self.assertFalse(instance._pending)
+
+    async def test_save__lazy(self):
+        class CustomModel(model.Model):
+            integer = fields.Integer()
+            string = fields.String()
+
+            class Meta:
+                collection = uuid.uuid4().hex
+                lazy = True
+
+        await CustomModel.objects.create(integer=1, string='a')
+        instance = await CustomModel.objects.get(integer=1)
+        instance.string = 'b'
+        await instance.save()
+
+        instance = await CustomModel.objects.get(integer=1)
+
+        self.assertEqual(
+            {'_id': str(instance._id), 'integer': 1, 'string': 'b'},
+            await instance.serialize()
+        )
+
+    async def test_save__partial_update(self):
+        class CustomModel(model.Model):
+            integer = fields.Integer()
+            string = fields.String()
+
+            class Meta:
+                collection = uuid.uuid4().hex
+
+        await CustomModel.objects.create(integer=1, string='a')
+        instance = await CustomModel.objects.get(integer=1)
+
+        await CustomModel.Meta.collection.update(
+            {'_id': instance._id}, {'$set': {'integer': 2}}
+        )
+
+        instance.string = 'b'
+        await instance.save()
+
+        instance = await CustomModel.objects.get(_id=instance._id)
+
+        self.assertEqual(2, instance.integer)
+        self.assertEqual('b', instance.string)
+
+    async def test_save__unset(self):
+        class CustomModel(model.Model):
+            integer = fields.Integer()
+            string = fields.String(required=False)
+
+            class Meta:
+                collection = uuid.uuid4().hex
+
+        instance = await CustomModel.objects.create(integer=1, string='a')
+        await instance.update(string=None)
+
+        data = await CustomModel.Meta.collection.find_one(
+            {'_id': instance._id}
+        )
+
+        self.assertNotIn('string', data)
+
+    async def test_save__in_place(self):
+        class CustomModel(model.Model):
+            array = fields.Array(field=fields.Integer())
+
+            class Meta:
+                collection = uuid.uuid4().hex
+
+        instance = await CustomModel.objects.create(array=[1])
+        instance = await CustomModel.objects.get(_id=instance._id)
+
+        instance.array.append(2)
+        await instance.save()
+
+        instance = await CustomModel.objects.get(_id=instance._id)
+
+        self.assertEqual([1, 2], instance.array)
+
+    async def test_save__in_place_json(self):
+        class CustomModel(model.Model):
+            payload = fields.JSON()
+
+            class Meta:
+                collection = uuid.uuid4().hex
+
+        instance = await CustomModel.objects.create(payload='{"key": 1}')
+        instance = await CustomModel.objects.get(_id=instance._id)
+
+        instance.payload['key'] = 2
+        await instance.save(force=True)
+
+        instance = await CustomModel.objects.get(_id=instance._id)
+
+        self.assertEqual({'key': 2}, instance.payload)
+
+    async def test_save__not_changed(self):
+        class CustomModel(model.Model):
+            array = fields.Array(field=fields.Integer())
+            datetime = fields.DateTime(auto_now=True)
+
+            class Meta:
+                collection = uuid.uuid4().hex
+
+        instance = await CustomModel.objects.create(array=[1])
+        instance = await CustomModel.objects.get(_id=instance._id)
+
+        collection = CustomModel.Meta.collection
+
+        with mock.patch.object(collection, 'update') as update:
+            await instance.save()
+
+        self.assertFalse(update.called)
+
+    async def test_save__hooks(self):
+        class CustomModel(model.Model):
+            string = fields.String()
+            datetime = fields.DateTime(auto_now=True)
+            created = fields.DateTime(auto_now_on_create=True)
+
+            class Meta:
+                collection = uuid.uuid4().hex
+
+        instance = await CustomModel.objects.create(string='a')
+        collection = CustomModel.Meta.collection
+
+        with mock.patch.object(
+                collection, 'update', wraps=collection.update) as update:
+            await instance.update(string='b')
+
+        __, document = update.call_args[0]
+
+        self.assertEqual({'$set'}, set(document))
+        self.assertEqual({'string', 'datetime'}, set(document['$set']))
@@ -35,6 +35,38 @@ class AutoReconnectTest(unittest.TestCase):
             f()
 
 
+class SlowQueryLogTest(monstro.testing.AsyncTestCase):
+
+    def setUp(self):
+        super().setUp()
+        proxy.slow_queries.threshold = 0
+
+    def tearDown(self):
+        proxy.slow_queries.threshold = None
+        super().tearDown()
+
+    def test_normalize(self):
+        self.assertEqual(
+            {'name': '?', '$or': [{'age': {'$gt': '?'}}], 'tags': '?'},
+            proxy.normalize(
+                {'name': 'a', '$or': [{'age': {'$gt': 1}}], 'tags': [1, 2]}
+            )
+        )
+
+    async def test_cursor(self):
+        with self.assertLogs('monstro', 'WARNING') as context:
+            await TestModel.objects.filter(name='Test').count()
+
+        self.assertIn('find.count on TestModel', context.output[0])
+        self.assertIn("filter={'name': '?'}", context.output[0])
+
+    async def test_write(self):
+        with self.assertLogs('monstro', 'WARNING') as context:
+            await TestModel.objects.filter(name='Test').delete()
+
+        self.assertIn('delete_many on TestModel', context.output[0])
+
+
 class MotorProxyTest(monstro.testing.AsyncTestCase):
 
     async def test(self):
@@ -42,6 +74,38 @@ class MotorProxyTest(monstro.testing.AsyncTestCase):
 
         self.assertTrue(instance._id)
 
+    def test_get_attribute__cached(self):
+        collection = TestModel.Meta.collection
+
+        self.assertIs(collection.find_one, collection.find_one)
+        self.assertIs(collection.database, collection.database)
+
+    def test_get_attribute__cursor(self):
+        cursor = TestModel.Meta.collection.find()
+        cursor.to_list
+
+        self.assertIsInstance(cursor, proxy.MotorProxy)
+        self.assertNotIn('to_list', cursor.__dict__)
+
+    def test_get_restart(self):
+        cursor = TestModel.Meta.collection.find({'name': 'name'}, limit=1)
+        instance = cursor.instance
+        restart = cursor.get_restart('to_list')
+
+        restart()
+
+        self.assertIsNot(instance, cursor.instance)
+        self.assertFalse(cursor.instance.started)
+        self.assertIsNone(cursor.get_restart('count'))
+
+    def test_get_restart__aggregate(self):
+        cursor = TestModel.Meta.collection.aggregate([])
+        instance = cursor.instance
+
+        cursor.get_restart('to_list')()
+
+        self.assertIsNot(instance, cursor.instance)
+
     def test_get_attribute(self):
         instance = proxy.MotorProxy(object)
         attribute = instance.__name__
@@ -1,8 +1,10 @@
 import uuid
 import random
 
+import bson.objectid
+
 import monstro.testing
-from monstro.db import Raw, fields
+from monstro.db import Raw, Sum, Count, Max, fields
 from monstro.db import model, exceptions
 from monstro.db.queryset import QuerySet
 from monstro.db.proxy import MotorProxy
@@ -69,6 +71,24 @@ class QuerySetTest(monstro.testing.AsyncTestCase):
             queryset.query
         )
 
+    async def test_validate__query_plan(self):
+        first = self.model.objects.filter(name='first', age__gte=1)
+        second = self.model.objects.filter(name='second', age__gte=2)
+
+        await first.validate()
+        await second.validate()
+
+        self.assertEqual(1, len(self.model.Meta.query_plans))
+        self.assertEqual({'name': 'first', 'age': {'$gte': 1}}, first.query)
+        self.assertEqual({'name': 'second', 'age': {'$gte': 2}}, second.query)
+
+    async def test_validate__id(self):
+        _id = bson.objectid.ObjectId()
+        queryset = self.model.objects.filter(_id=str(_id))
+        await queryset.validate()
+
+        self.assertEqual({'_id': _id}, queryset.query)
+
     async def test_cursor_method(self):
         queryset = self.model.objects.filter()
 
@@ -185,3 +205,290 @@ class QuerySetTest(monstro.testing.AsyncTestCase):
 
         async for item in queryset:
             self.assertIsInstance(item.key, str)
+
+    async def test_prefetch_related(self):
+        queryset = self.model.objects.prefetch_related('key')
+        items = []
+
+        async for item in queryset:
+            items.append(item)
+
+        self.assertEqual(self.number, len(items))
+
+        for item in items:
+            self.assertIsInstance(item.key, self.related_model)
+            self.assertEqual(self.related._id, item.key._id)
+
+    async def test_prefetch_related__all(self):
+        queryset = self.model.objects.prefetch_related()
+
+        self.assertEqual(('key',), queryset._prefetch_related)
+
+    async def test_prefetch_related__many_to_many(self):
+        class Test(model.Model):
+
+            keys = fields.ManyToMany(to=self.related_model)
+
+            class Meta:
+                collection = uuid.uuid4().hex
+
+        related = await self.related_model.objects.create(name='test2')
+        await Test.objects.create(keys=[self.related, related])
+
+        item = await Test.objects.prefetch_related('keys').first()
+
+        self.assertEqual(
+            [self.related._id, related._id], [key._id for key in item.keys]
+        )
+
+    async def test_prefetch_related__many_to_many__save(self):
+        class Test(model.Model):
+
+            keys = fields.ManyToMany(to=self.related_model)
+
+            class Meta:
+                collection = uuid.uuid4().hex
+
+        related = await self.related_model.objects.create(name='test2')
+        await Test.objects.create(keys=[self.related])
+
+        item = await Test.objects.prefetch_related('keys').first()
+        item.keys.append(related)
+        await item.save()
+
+        item = await Test.objects.prefetch_related('keys').first()
+
+        self.assertEqual(
+            [self.related._id, related._id], [key._id for key in item.keys]
+        )
+
+    async def test_prefetch_related__missing(self):
+        await self.model.Meta.collection.insert({'name': 'test', 'key': 'no'})
+
+        item = await self.model.objects.prefetch_related().get(name='test')
+
+        self.assertIsNone(item.key)
+
+    def test_prefetch_related__invalid_field(self):
+        with self.assertRaises(exceptions.InvalidQuery):
+            self.model.objects.prefetch_related('name')
+
+    async def test_update(self):
+        result = await self.model.objects.filter(name='test0').update(
+            name='updated', age__inc=2
+        )
+        instance = await self.model.objects.get(name='updated')
+
+        self.assertEqual({'matched': 1, 'modified': 1}, result)
+        self.assertEqual(2, instance.age)
+
+    async def test_update__unset(self):
+        await self.model.objects.filter().update(age=None)
+
+        self.assertEqual(0, await self.model.objects.filter(age=0).count())
+
+    async def test_update__validation_error(self):
+        with self.assertRaises(exceptions.ValidationError) as context:
+            await self.model.objects.filter().update(age='wrong')
+
+        self.assertIn('age', context.exception.error)
+
+    async def test_update__invalid_field(self):
+        with self.assertRaises(exceptions.InvalidQuery):
+            await self.model.objects.filter().update(wrong=1)
+
+    async def test_update__sliced(self):
+        with self.assertRaises(exceptions.InvalidQuery):
+            await self.model.objects.filter()[:2].update(age=1)
+
+    async def test_delete(self):
+        queryset = self.model.objects.filter(name__in=['test0', 'test1'])
+        deleted = await queryset.delete()
+
+        self.assertEqual(2, deleted)
+        self.assertEqual(
+            self.number - 2, await self.model.objects.filter().count()
+        )
+
+    async def test_aggregate(self):
+        await self.model.objects.filter(name='test0').update(age=10)
+
+        result = await self.model.objects.filter().aggregate(
+            Sum('age'), Count(), maximum=Max('age')
+        )
+
+        self.assertEqual(
+            {'age__sum': 10, 'count': self.number, 'maximum': 10}, result
+        )
+
+    async def test_aggregate__empty(self):
+        result = await self.model.objects.filter(name='none').aggregate(
+            Sum('age')
+        )
+
+        self.assertEqual({'age__sum': None}, result)
+
+    async def test_aggregate__sliced(self):
+        queryset = self.model.objects.filter().order_by('name')[1:3]
+        result = await queryset.aggregate(Count())
+
+        self.assertEqual({'count': 2}, result)
+
+    async def test_aggregate__invalid_field(self):
+        with self.assertRaises(exceptions.InvalidQuery):
+            await self.model.objects.filter().aggregate(Sum('wrong'))
+
+    async def test_group_by(self):
+        await self.model.objects.filter(name__in=['test0', 'test1']).update(
+            age=1
+        )
+
+        queryset = self.model.objects.group_by('age').annotate(Count())
+        items = []
+
+        async for item in queryset.pipeline([{'$sort': {'age': 1}}]):
+            items.append(item)
+
+        self.assertEqual(
+            [
+                {'age': 0, 'count': self.number - 2},
+                {'age': 1, 'count': 2}
+            ],
+            items
+        )
+        self.assertEqual(2, await queryset.count())
+
+    async def test_pipeline(self):
+        queryset = self.model.objects.filter(name='test0').pipeline([
+            {'$project': {'_id': False, 'name': True}}
+        ])
+
+        self.assertEqual({'name': 'test0'}, await queryset.get())
+
+    async def test_batches(self):
+        batches = []
+
+        async for batch in self.model.objects.order_by('name').batches(3):
+            batches.append(batch)
+
+        self.assertEqual(3, len(batches[0]))
+        self.assertEqual(self.number, sum(len(batch) for batch in batches))
+        self.assertIsInstance(batches[0][0], self.model)
+
+    async def test_batches__read_ahead(self):
+        names = []
+
+        async for batch in self.model.objects.values('name').batches(
+                4, read_ahead=True):
+            names.extend(item['name'] for item in batch)
+
+        self.assertEqual(
+            sorted('test{}'.format(i) for i in range(self.number)),
+            sorted(names)
+        )
+
+    async def test_cache(self):
+        queryset = self.model.objects.filter().cache()
+
+        with self.assertRaises(TypeError):
+            len(queryset)
+
+        items = await queryset.evaluate()
+        await self.model.objects.filter(name='test0').delete()
+
+        self.assertTrue(queryset.evaluated)
+        self.assertEqual(self.number, len(queryset))
+        self.assertEqual(self.number, await queryset.count())
+        self.assertTrue(await queryset.exists())
+        self.assertIs(items[1], await queryset[1])
+
+        iterated = []
+
+        async for item in queryset:
+            iterated.append(item)
+
+        self.assertEqual(items, iterated)
+
+    async def test_cache__clone(self):
+        queryset = self.model.objects.filter().cache()
+        await queryset.evaluate()
+
+        self.assertFalse(queryset.filter(name='test0').evaluated)
+        self.assertEqual(
+            self.number - 1,
+            await queryset.filter(name__ne='test0').count()
+        )
+
+    async def test_exists(self):
+        self.assertTrue(await self.model.objects.filter(name='test0').exists())
+        self.assertFalse(await self.model.objects.filter(name='none').exists())
+
+    async def test_read_from(self):
+        queryset = self.model.objects.read_from('secondaryPreferred')
+
+        self.assertEqual(
+            'secondaryPreferred',
+            queryset.reader.read_preference.mongos_mode
+        )
+        self.assertIs(queryset.reader, queryset.filter().reader)
+        self.assertEqual(self.number, await queryset.count())
+
+    def test_read_from__invalid(self):
+        with self.assertRaises(exceptions.InvalidQuery):
+            self.model.objects.read_from('anywhere')
+
+    async def test_explain(self):
+        explanation = await self.model.objects.filter(name='test0').explain()
+
+        self.assertIn('stage', explanation['winning_plan'])
+        self.assertEqual(self.number, explanation['docs_examined'])
+
+    def test_get_explanation__aggregation(self):
+        explanation = QuerySet.get_explanation({'stages': [{'$cursor': {
+            'queryPlanner': {'winningPlan': {'stage': 'COLLSCAN'}},
+            'executionStats': {'totalKeysExamined': 0, 'totalDocsExamined': 2}
+        }}]})
+
+        self.assertEqual(
+            {
+                'winning_plan': {'stage': 'COLLSCAN'},
+                'keys_examined': 0,
+                'docs_examined': 2
+            },
+            explanation
+        )
+
+    async def test_defer(self):
+        item = await self.model.objects.defer('age').get(name='test0')
+
+        self.assertEqual('test0', item.name)
+        self.assertFalse(item.is_loaded('age'))
+
+        with self.assertRaises(exceptions.DeferredFieldError):
+            __ = item.age
+
+    async def test_defer__id(self):
+        with self.assertRaises(exceptions.InvalidQuery):
+            self.model.objects.defer('_id')
+
+    async def test_defer__save(self):
+        await self.model.objects.filter(name='test0').update(age=10)
+
+        item = await self.model.objects.defer('age').get(name='test0')
+        item.name = 'deferred'
+        await item.save()
+
+        item = await self.model.objects.get(name='deferred')
+
+        self.assertEqual(10, item.age)
+
+    async def test_only__save(self):
+        await self.model.objects.filter(name='test0').update(age=10)
+
+        item = await self.model.objects.only('name').get(name='test0')
+        item.name = 'only'
+        await item.save()
+
+        item = await self.model.objects.get(name='only')
+
+        self.assertEqual(10, item.age)
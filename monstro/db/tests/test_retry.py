@@ -0,0 +1,146 @@
+from unittest import mock
+
+import pymongo.errors
+import tornado.concurrent
+
+from monstro.db import exceptions, retry
+import monstro.testing
+
+
+def resolve(value=None, exception=None):
+    future = tornado.concurrent.Future()
+
+    if exception is not None:
+        future.set_exception(exception)
+    else:
+        future.set_result(value)
+
+    return future
+
+
+class CircuitBreakerTest(monstro.testing.AsyncTestCase):
+
+    def test_open(self):
+        breaker = retry.CircuitBreaker(threshold=2, timeout=30)
+
+        breaker.failure()
+        self.assertTrue(breaker.allow())
+
+        breaker.failure()
+        self.assertFalse(breaker.allow())
+        self.assertEqual(retry.OPEN, breaker.state)
+        self.assertEqual(1, breaker.trips)
+        self.assertEqual(1, breaker.rejected)
+
+    def test_half_open(self):
+        breaker = retry.CircuitBreaker(threshold=1, timeout=0)
+
+        breaker.failure()
+
+        self.assertTrue(breaker.allow())
+        self.assertEqual(retry.HALF_OPEN, breaker.state)
+
+        breaker.success()
+
+        self.assertEqual(retry.CLOSED, breaker.state)
+
+    def test_half_open__single_probe(self):
+        breaker = retry.CircuitBreaker(threshold=1, timeout=0)
+
+        breaker.failure()
+
+        self.assertTrue(breaker.allow())
+        self.assertFalse(breaker.allow())
+        self.assertEqual(1, breaker.rejected)
+
+        breaker.release()
+
+        self.assertTrue(breaker.allow())
+
+
+class RetryPolicyTest(monstro.testing.AsyncTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.policy = retry.RetryPolicy(
+            attempts=3, backoff=0, failure_threshold=10
+        )
+
+    async def test_retry(self):
+        function = mock.Mock(side_effect=[
+            resolve(exception=pymongo.errors.AutoReconnect()),
+            resolve(1)
+        ])
+
+        result = await self.policy.call(function, 'find_one', (), {})
+
+        self.assertEqual(1, result)
+        self.assertEqual(2, function.call_count)
+        self.assertEqual(1, self.policy.get_metrics()['retries'])
+        self.assertEqual(retry.CLOSED, self.policy.get_metrics()['state'])
+
+    async def test_retry__attempts(self):
+        function = mock.Mock(side_effect=lambda: resolve(
+            exception=pymongo.errors.AutoReconnect()
+        ))
+
+        with self.assertRaises(pymongo.errors.AutoReconnect):
+            await self.policy.call(function, 'find_one', (), {})
+
+        self.assertEqual(3, function.call_count)
+
+    async def test_not_idempotent(self):
+        function = mock.Mock(side_effect=lambda: resolve(
+            exception=pymongo.errors.AutoReconnect()
+        ))
+
+        with self.assertRaises(pymongo.errors.AutoReconnect):
+            await self.policy.call(function, 'insert_one', (), {})
+
+        self.assertEqual(1, function.call_count)
+        self.assertEqual(1, self.policy.get_metrics()['failures'])
+
+    async def test_retry__restart(self):
+        function = mock.Mock(side_effect=lambda: resolve(
+            exception=pymongo.errors.AutoReconnect()
+        ))
+        fresh = mock.Mock(return_value=resolve([1]))
+
+        result = await self.policy.call(
+            function, 'to_list', (), {}, restart=lambda: fresh
+        )
+
+        self.assertEqual([1], result)
+        self.assertEqual(1, function.call_count)
+        self.assertEqual(1, fresh.call_count)
+
+    async def test_half_open__probe(self):
+        self.policy.breaker.threshold = 1
+        self.policy.breaker.timeout = 0
+        self.policy.breaker.failure()
+        future = tornado.concurrent.Future()
+
+        probe = self.policy.call(
+            mock.Mock(return_value=future), 'insert_one', (), {}
+        )
+
+        with self.assertRaises(exceptions.DatabaseUnavailable):
+            self.policy.call(mock.Mock(), 'insert_one', (), {})
+
+        future.set_result(None)
+        await probe
+
+        self.assertEqual(retry.CLOSED, self.policy.get_metrics()['state'])
+
+    def test_circuit_open(self):
+        self.policy.breaker.threshold = 1
+        self.policy.breaker.failure()
+
+        with self.assertRaises(exceptions.DatabaseUnavailable):
+            self.policy.call(mock.Mock(), 'find_one', (), {})
+
+    def test_get_delay(self):
+        policy = retry.RetryPolicy(backoff=0.1, max_backoff=0.3)
+
+        for attempt in range(5):
+            self.assertLessEqual(policy.get_delay(attempt), 0.3)
@@ -1,8 +1,12 @@
 import unittest
+from unittest import mock
 
 from monstro.conf import settings
+from monstro.core.exceptions import ImproperlyConfigured
 from monstro.db import databases
+from monstro.db import pool, retry
 from monstro.db.proxy import MotorProxy
+import monstro.testing
 
 
 class RouterTest(unittest.TestCase):
@@ -22,3 +26,107 @@ class RouterTest(unittest.TestCase):
         databases.set('another', database.instance)
 
         self.assertEqual(database.name, databases.get('another').name)
+
+    def test_set__retry_policy(self):
+        database = databases.get()
+        policy = retry.RetryPolicy('retried')
+
+        databases.set('retried', database.instance, policy=policy)
+
+        self.assertIs(policy, databases.get('retried').policy)
+        self.assertEqual(
+            retry.CLOSED, databases.get_retry_metrics('retried')['state']
+        )
+
+    def test_set__without_retry_policy(self):
+        databases.set('plain', databases.get().instance)
+
+        self.assertIsNone(databases.get('plain').policy)
+        self.assertIsNone(databases.get_retry_metrics('plain'))
+
+    def test_get_retry_policy(self):
+        policy = databases.get_retry_policy(
+            {'alias': 'retried', 'retry': {'attempts': 5}}
+        )
+
+        self.assertEqual(5, policy.attempts)
+
+    def test_get_retry_policy__not_configured(self):
+        self.assertIsNone(
+            databases.get_retry_policy({'alias': 'plain', 'retry': {}})
+        )
+
+    def test_get_retry_policy__invalid(self):
+        with self.assertRaises(ImproperlyConfigured):
+            databases.get_retry_policy(
+                {'alias': 'invalid', 'retry': {'unknown': 1}}
+            )
+
+    def test_set__read_preference(self):
+        database = databases.get()
+
+        databases.set('secondary', database, 'secondaryPreferred')
+
+        self.assertEqual(
+            'secondaryPreferred', databases.get_read_preference('secondary')
+        )
+        self.assertIsNone(databases.get_read_preference())
+
+    def test_set__invalid_read_preference(self):
+        with self.assertRaises(ImproperlyConfigured):
+            databases.set('invalid', databases.get(), 'anywhere')
+
+
+class PoolMetricsTest(monstro.testing.AsyncTestCase):
+
+    def test_get_client_options(self):
+        metrics = pool.PoolMetrics()
+        options = pool.get_client_options(
+            {'options': {'appname': 'test'}, 'max_pool_size': 10}, metrics
+        )
+
+        self.assertEqual(
+            {
+                'appname': 'test',
+                'maxPoolSize': 10,
+                'event_listeners': [metrics]
+            },
+            options
+        )
+
+    def test_events(self):
+        metrics = pool.PoolMetrics()
+        event = mock.Mock(address=('localhost', 27017))
+
+        metrics.connection_created(event)
+        metrics.connection_check_out_started(event)
+        metrics.connection_check_out_started(event)
+
+        self.assertEqual(2, metrics.get()['waiters'])
+
+        metrics.connection_checked_out(event)
+        metrics.connection_check_out_failed(event)
+
+        data = metrics.get()
+
+        self.assertEqual(1, data['connections'])
+        self.assertEqual(1, data['checked_out'])
+        self.assertEqual(0, data['waiters'])
+        self.assertEqual(1, data['failures'])
+        self.assertGreater(data['wait_time'], 0)
+
+    def test_get_client_options__unsupported(self):
+        options = pool.get_client_options({'max_pool_size': 10}, None)
+
+        self.assertEqual({'maxPoolSize': 10}, options)
+
+    def test_get_pool_metrics__unsupported(self):
+        with mock.patch.object(pool, 'ConnectionPoolListener', None):
+            self.assertIsNone(pool.get_pool_metrics())
+
+    @unittest.skipIf(pool.ConnectionPoolListener is None,
+                     'Connection pool events require PyMongo 3.9')
+    async def test_warm_up(self):
+        await databases.warm_up()
+
+        self.assertGreater(databases.get_pool_metrics()['checkouts'], 0)
@@ -0,0 +1,62 @@
+from .exceptions import ValidationError
+from .fields import Field
+
+
+SYNC = 1
+ASYNC = 2
+
+
+def get_validate_mode(field):
+    if field.synchronous and type(field).validate is Field.validate:
+        return SYNC
+
+    return ASYNC
+
+
+def get_serialize_mode(field):
+    if field.synchronous:
+        return SYNC
+
+    return ASYNC
+
+
+class Plan(object):
+
+    def __init__(self, fields):
+        self.steps = [
+            (name, field, get_validate_mode(field), get_serialize_mode(field))
+            for name, field in fields.items()
+        ]
+
+    async def validate(self, data, instance=None):
+        errors = {}
+
+        for name, field, mode, __ in self.steps:
+            if instance is not None and field.read_only:
+                data[name] = getattr(instance, name, field.default)
+                continue
+
+            try:
+                if mode is SYNC and not field.validators:
+                    data[name] = field.clean(data.get(name))
+                else:
+                    data[name] = await field.validate(data.get(name))
+            except ValidationError as e:
+                errors[name] = e.error
+
+        return errors
+
+    async def serialize(self, data, raw_fields=()):
+        result = {}
+
+        for name, field, __, mode in self.steps:
+            value = data.get(name)
+
+            if value is None or name in raw_fields:
+                result[name] = value
+            elif mode is SYNC:
+                result[name] = field.to_primitive(value)
+            else:
+                result[name] = await field.serialize(value)
+
+        return result
@@ -66,6 +66,7 @@ class Field(object):
         _errors.update(errors or {})
 
         self.errors = _errors
+        self.messages = {}
 
     @property
     def label(self):
@@ -81,8 +82,28 @@ class Field(object):
 
         return self._default
 
+    @property
+    def synchronous(self):
+        return (
+            type(self).deserialize is Field.deserialize
+            and type(self).serialize is Field.serialize
+        )
+
     def bind(self, **kwargs):
         self.__dict__.update(kwargs)
+        self.messages = {}
+
+    def clean(self, value):
+        if value is None:
+            value = self.default
+
+        if value is None:
+            if self.required:
+                self.fail('required')
+            else:
+                return None
+
+        return self.to_python(value)
 
     async def validate(self, value):
         if value is None:
@@ -102,15 +123,26 @@ class Field(object):
         return value
 
     def fail(self, error, **kwargs):
-        raise ValidationError(
-            self.errors[error].format(self, **kwargs), self.name
-        )
+        if kwargs:
+            message = self.errors[error].format(self, **kwargs)
+        elif error in self.messages:
+            message = self.messages[error]
+        else:
+            message = self.messages[error] = self.errors[error].format(self)
+
+        raise ValidationError(message, self.name)
+
+    def to_python(self, value):
+        return value
 
     async def deserialize(self, value):
+        return self.to_python(value)
+
+    def to_primitive(self, value):
         return value
 
     async def serialize(self, value):
-        return value
+        return self.to_primitive(value)
 
     async def get_options(self):
         options = {
@@ -140,7 +172,7 @@ class Type(Field):
         'invalid': 'Value must be a valid {0.type.__name__}'
     }
 
-    async def deserialize(self, value):
+    def to_python(self, value):
         if not isinstance(value, self.type):
             self.fail('invalid')
 
@@ -170,8 +202,8 @@ class String(Type):
         self.max_length = max_length
         super().__init__(**kwargs)
 
-    async def deserialize(self, value):
-        value = await super().deserialize(value)
+    def to_python(self, value):
+        value = super().to_python(value)
 
         if self.min_length is not None and len(value) < self.min_length:
             self.fail('min_length')
@@ -195,7 +227,7 @@ class Numeric(Type):
         self.max_value = max_value
         super().__init__(**kwargs)
 
-    async def deserialize(self, value):
+    def to_python(self, value):
         try:
             value = self.type(value)
         except (TypeError, ValueError):
@@ -233,15 +265,33 @@ class Choice(Field):
     }
 
     def __init__(self, *, choices, **kwargs):
-        self.choices = list(choices)
+        self.choices = choices
         self.widget = widgets.Select(self.choices)
         super().__init__(**kwargs)
 
-    async def deserialize(self, value):
-        choices = [choice[0] for choice in self.choices]
+    @property
+    def choices(self):
+        return self._choices
+
+    @choices.setter
+    def choices(self, choices):
+        self._choices = list(choices)
+        self.values = [choice[0] for choice in self._choices]
 
-        if value not in choices:
-            self.fail('invalid', choices=choices)
+        try:
+            self.lookup = frozenset(self.values)
+        except TypeError:
+            self.lookup = self.values
+
+    def is_choice(self, value):
+        try:
+            return value in self.lookup
+        except TypeError:
+            return value in self.values
+
+    def to_python(self, value):
+        if not self.is_choice(value):
+            self.fail('invalid', choices=self.values)
 
         return value
 
@@ -258,8 +308,16 @@ class Array(Type):
         self.field = field
         super().__init__(**kwargs)
 
-    async def deserialize(self, value):
-        value = await super().deserialize(value)
+    @property
+    def synchronous(self):
+        return (
+            type(self).deserialize is Array.deserialize
+            and type(self).serialize is Array.serialize
+            and (self.field is None or self.field.synchronous)
+        )
+
+    def to_python(self, value):
+        value = super().to_python(value)
 
         if self.field:
             values = []
@@ -267,27 +325,55 @@ class Array(Type):
 
             for index, item in enumerate(value):
                 try:
-                    values.append(await self.field.deserialize(item))
+                    values.append(self.field.to_python(item))
                 except ValidationError as e:
                     errors[index] = e.error
 
             if errors:
                 raise ValidationError(errors, self.name)
 
-            return values
+            return self.check_items(values)
+
+        return self.check_items(value)
+
+    def check_items(self, values):
+        return values
+
+    async def deserialize(self, value):
+        if self.field is None or self.field.synchronous:
+            return self.to_python(value)
+
+        value = super().to_python(value)
+        values = []
+        errors = {}
+
+        for index, item in enumerate(value):
+            try:
+                values.append(await self.field.deserialize(item))
+            except ValidationError as e:
+                errors[index] = e.error
+
+        if errors:
+            raise ValidationError(errors, self.name)
+
+        return self.check_items(values)
+
+    def to_primitive(self, value):
+        if self.field:
+            return [self.field.to_primitive(item) for item in value]
 
         return value
 
     async def serialize(self, value):
-        if self.field:
-            values = []
+        if self.field is None or self.field.synchronous:
+            return self.to_primitive(value)
 
-            for item in value:
-                values.append(await self.field.serialize(item))
+        values = []
 
-            return values
+        for item in value:
+            values.append(await self.field.serialize(item))
 
-        return value
+        return values
 
 
 class MultipleChoice(Array, Choice):
@@ -302,15 +388,11 @@ class MultipleChoice(Array, Choice):
 
         self.widget.attributes['multiple'] = True
 
-    async def deserialize(self, value):
-        value = await Array.deserialize(self, value)
-
-        choices = [choice[0] for choice in self.choices]
+    def check_items(self, values):
+        if not all(self.is_choice(value) for value in values):
+            self.fail('choices', choices=self.values)
 
-        if any(choice not in choices for choice in value):
-            self.fail('choices', choices=choices)
-
-        return value
+        return values
 
 
 class URL(String):
@@ -319,8 +401,8 @@ class URL(String):
         'url': 'Value must be a valid URL',
     }
 
-    async def deserialize(self, value):
-        value = await super().deserialize(value)
+    def to_python(self, value):
+        value = super().to_python(value)
 
         url = urllib.parse.urlparse(value)
 
@@ -340,8 +422,8 @@ class RegexMatch(String):
         self.pattern = re.compile(pattern or self.pattern)
         super().__init__(**kwargs)
 
-    async def deserialize(self, value):
-        value = await super().deserialize(value)
+    def to_python(self, value):
+        value = super().to_python(value)
 
         if not self.pattern.match(value):
             self.fail('pattern')
@@ -383,7 +465,18 @@ class Map(Field):
 
         self.schema = schema
 
-    async def deserialize(self, value):
+    @property
+    def synchronous(self):
+        return (
+            type(self).deserialize is Map.deserialize
+            and type(self).serialize is Map.serialize
+            and all(
+                field.synchronous and not field.validators
+                for field in (self.schema or {}).values()
+            )
+        )
+
+    def to_python(self, value):
         if not isinstance(value, dict):
             self.fail('invalid')
 
@@ -392,7 +485,7 @@ class Map(Field):
 
             for name, field in self.schema.items():
                 try:
-                    value[name] = await field.validate(value.get(name))
+                    value[name] = field.clean(value.get(name))
                 except ValidationError as e:
                     errors[name] = e.error
 
@@ -401,10 +494,39 @@ class Map(Field):
 
         return value
 
-    async def serialize(self, value):
+    async def deserialize(self, value):
+        if self.synchronous:
+            return self.to_python(value)
+
+        if not isinstance(value, dict):
+            self.fail('invalid')
+
+        errors = {}
+
+        for name, field in self.schema.items():
+            try:
+                value[name] = await field.validate(value.get(name))
+            except ValidationError as e:
+                errors[name] = e.error
+
+        if errors:
+            raise ValidationError(errors, self.name)
+
+        return value
+
+    def to_primitive(self, value):
         if self.schema:
             for name, field in self.schema.items():
-                value[name] = await field.serialize(value[name])
+                value[name] = field.to_primitive(value[name])
+
+        return value
+
+    async def serialize(self, value):
+        if self.synchronous:
+            return self.to_primitive(value)
+
+        for name, field in self.schema.items():
+            value[name] = await field.serialize(value[name])
 
         return value
 
@@ -416,13 +538,13 @@ class JSON(Field):
         'invalid': 'Value must be a valid JSON string',
     }
 
-    async def deserialize(self, value):
+    def to_python(self, value):
         try:
             return json.loads(value)
         except (ValueError, TypeError):
             self.fail('invalid')
 
-    async def serialize(self, value):
+    def to_primitive(self, value):
         return json.dumps(value)
 
 
@@ -440,6 +562,9 @@ class DateTime(Field):
 
         super().__init__(**kwargs)
         self.input_formats = input_formats or []
+        self.available_formats = list(
+            set(self.input_formats + [self.default_format])
+        )
         self.output_format = output_format
         self.auto_now = auto_now
         self.auto_now_on_create = auto_now_on_create
@@ -449,11 +574,7 @@ class DateTime(Field):
 
         self.widget.attributes['format'] = self.output_format
 
-    @property
-    def available_formats(self):
-        return list(set(self.input_formats + [self.default_format]))
-
-    async def deserialize(self, value):
+    def to_python(self, value):
         if isinstance(value, str):
             for input_format in self.available_formats:
                 try:
@@ -468,7 +589,7 @@ class DateTime(Field):
 
         return value
 
-    async def serialize(self, value):
+    def to_primitive(self, value):
         return value.isoformat()
 
 
@@ -481,8 +602,8 @@ class Date(DateTime):
 
     default_format = '%Y-%m-%d'
 
-    async def deserialize(self, value):
-        return (await super().deserialize(value)).date()
+    def to_python(self, value):
+        return super().to_python(value).date()
 
 
 class Time(DateTime):
@@ -494,8 +615,8 @@ class Time(DateTime):
 
     default_format = '%H:%M:%S'
 
-    async def deserialize(self, value):
-        return (await super().deserialize(value)).time()
+    def to_python(self, value):
+        return super().to_python(value).time()
 
 
 class PythonPath(String):
@@ -504,15 +625,15 @@ class PythonPath(String):
         'import': 'Path must be available for import'
     }
 
-    async def deserialize(self, value):
-        value = await super().deserialize(value)
+    def to_python(self, value):
+        value = super().to_python(value)
 
         try:
             return import_object(value)
         except ImportError:
             self.fail('import')
 
-    async def serialize(self, value):
+    def to_primitive(self, value):
         if isinstance(value, types.ModuleType):
             return value.__name__
 
@@ -525,13 +646,13 @@ class RegularExpression(String):
         'invalid': 'Value must be a valid Python regular expression'
     }
 
-    async def deserialize(self, value):
-        value = await super().deserialize(value)
+    def to_python(self, value):
+        value = super().to_python(value)
 
         try:
             return re.compile(value)
         except re.error:
             self.fail('invalid')
 
-    async def serialize(self, value):
+    def to_primitive(self, value):
         return value.pattern
@@ -1,5 +1,6 @@
 import collections
 
+from .compiler import Plan
 from .exceptions import ValidationError
 from .fields import Field
 
@@ -28,6 +29,7 @@ class MetaForm(type):
         cls = type.__new__(mcs, name, bases, attributes)
 
         cls.Meta.fields = fields
+        cls.Meta.plan = Plan(fields)
         cls.ValidationError = ValidationError
 
         return cls
@@ -73,30 +75,15 @@ class Form(object, metaclass=MetaForm):
             return not bool(self.errors)  # pylint:disable=W0150
 
     async def validate(self):
-        for name, field in self.Meta.fields.items():
-            value = self.data.get(name)
-
-            try:
-                self.data[name] = await field.validate(value)
-            except ValidationError as e:
-                self.errors[name] = e.error
+        self.errors.update(await self.Meta.plan.validate(self.data))
 
         if self.errors:
             raise self.ValidationError(self.errors)
 
     async def serialize(self, raw_fields=()):
         raw_fields = raw_fields or getattr(self.Meta, 'raw_fields', ())
-        data = {}
-
-        for name, field in self.Meta.fields.items():
-            value = self.data.get(name)
-
-            if value is None or name in raw_fields:
-                data[name] = value
-            else:
-                data[name] = await field.serialize(value)
 
-        return data
+        return await self.Meta.plan.serialize(self.data, raw_fields)
 
 
 class ModelForm(Form, metaclass=MetaModelForm):
@@ -111,17 +98,9 @@ class ModelForm(Form, metaclass=MetaModelForm):
             self.data[name] = value
 
     async def validate(self):
-        for name, field in self.Meta.fields.items():
-            if field.read_only:
-                self.data[name] = getattr(self.instance, name, field.default)
-                continue
-
-            value = self.data.get(name)
-
-            try:
-                self.data[name] = await field.validate(value)
-            except ValidationError as e:
-                self.errors[name] = e.error
+        self.errors.update(
+            await self.Meta.plan.validate(self.data, self.instance)
+        )
 
         if self.errors:
             raise self.ValidationError(self.errors)
@@ -130,14 +109,11 @@ class ModelForm(Form, metaclass=MetaModelForm):
         await self.instance.update(**self.data)
 
         for name in self.Meta.fields.keys():
-            self.data[name] = self.instance.Meta.data[name]
+            self.data[name] = getattr(self.instance, name)
 
         return self.instance
 
     async def serialize(self, raw_fields=()):
-        raw_fields = (
-            raw_fields
-            or getattr(getattr(self.instance, 'Meta', {}), 'raw_fields', ())
-        )
+        raw_fields = raw_fields or getattr(self.instance, '_raw_fields', ())
 
         return await super().serialize(raw_fields)
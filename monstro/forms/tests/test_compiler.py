@@ -0,0 +1,56 @@
+from monstro import forms
+from monstro.forms import compiler
+import monstro.testing
+
+
+class Upper(forms.String):
+
+    async def deserialize(self, value):
+        return self.to_python(value).upper()
+
+
+class CompilerTest(monstro.testing.AsyncTestCase):
+
+    class Form(forms.Form):
+        name = forms.String()
+        kind = forms.Choice(choices=(('a', 'A'), ('b', 'B')), required=False)
+        tags = forms.Array(field=Upper(), required=False)
+
+    def test_modes(self):
+        steps = {step[0]: step[2:] for step in self.Form.Meta.plan.steps}
+
+        self.assertEqual((compiler.SYNC, compiler.SYNC), steps['name'])
+        self.assertEqual((compiler.SYNC, compiler.SYNC), steps['kind'])
+        self.assertEqual((compiler.ASYNC, compiler.ASYNC), steps['tags'])
+
+    async def test_validate(self):
+        data = {'name': 'name', 'kind': 'a', 'tags': ['tag']}
+
+        errors = await self.Form.Meta.plan.validate(data)
+
+        self.assertEqual({}, errors)
+        self.assertEqual(['TAG'], data['tags'])
+
+    async def test_validate__errors(self):
+        errors = await self.Form.Meta.plan.validate({'kind': 'c'})
+
+        self.assertEqual('Value is required', errors['name'])
+        self.assertEqual("Value must be in ['a', 'b']", errors['kind'])
+
+    async def test_validate__validators(self):
+        async def upper(value):
+            return value.upper()
+
+        field = forms.String(name='name', validators=[upper])
+        data = {'name': 'name'}
+
+        await compiler.Plan({'name': field}).validate(data)
+
+        self.assertEqual('NAME', data['name'])
+
+    async def test_serialize(self):
+        data = await self.Form.Meta.plan.serialize(
+            {'name': 'name', 'tags': ['tag']}, ('name',)
+        )
+
+        self.assertEqual({'name': 'name', 'kind': None, 'tags': ['tag']}, data)
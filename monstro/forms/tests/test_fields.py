@@ -19,6 +19,24 @@ class FieldTest(monstro.testing.AsyncTestCase):
 
         self.assertEqual(None, await field.serialize(None))
 
+    def test_to_python(self):
+        self.assertEqual(1, fields.Integer().to_python('1'))
+
+    def test_to_primitive(self):
+        self.assertEqual(
+            ['[1]'], fields.Array(field=fields.JSON()).to_primitive([[1]])
+        )
+
+    def test_synchronous(self):
+        async def validator(value):
+            return value
+
+        self.assertTrue(fields.Array(field=fields.Integer()).synchronous)
+        self.assertFalse(
+            fields.Map(schema={'id': fields.Integer(validators=[validator])})
+            .synchronous
+        )
+
     def test_create_label_from_name(self):
         field = fields.Field(name='some_field')
 
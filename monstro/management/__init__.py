@@ -42,6 +42,7 @@ def manage():
 
     commands = {
         'db': 'monstro.management.commands.db.DatabaseShell',
+        'indexes': 'monstro.management.commands.indexes.SyncIndexes',
         'migrate': 'monstro.management.commands.migrate.ApplyMigrations',
         'new': 'monstro.management.commands.new.NewTemplate',
         'run': 'monstro.management.commands.run.RunServer',
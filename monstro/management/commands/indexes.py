@@ -0,0 +1,31 @@
+from tornado.util import import_object
+import tornado.ioloop
+
+from monstro.conf import settings
+from monstro.management import Command
+
+
+class SyncIndexes(Command):
+
+    def add_arguments(self, parser):
+        parser.add_argument('--drop', action='store_true')
+
+    def execute(self, arguments):
+        tornado.ioloop.IOLoop.instance().run_sync(
+            lambda: self._sync(arguments.drop)
+        )
+
+    async def _sync(self, drop):
+        for path in getattr(settings, 'models', []):
+            result = await import_object(path).prepare(drop)
+
+            for name in result['created']:
+                print('{}: created {}.'.format(path, name))
+
+            for name in result['dropped']:
+                print('{}: dropped {}.'.format(path, name))
+
+            for name in result['stale']:
+                print('{}: stale {} (use --drop to remove).'.format(
+                    path, name
+                ))
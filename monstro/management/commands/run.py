@@ -1,9 +1,8 @@
-from tornado.util import import_object
 import tornado.ioloop
 import tornado.httpserver
 
-from monstro.conf import settings
 from monstro.core.app import application
+from monstro.db import databases
 from monstro.management import Command
 
 
@@ -15,12 +14,8 @@ class RunServer(Command):
         parser.add_argument('--host', default='127.0.0.1')
         parser.add_argument('--port', default=8000)
 
-    def prepare_models(self):
-        for path in getattr(settings, 'models', []):
-            self.ioloop.spawn_callback(import_object(path).prepare)
-
     def execute(self, arguments):
-        self.prepare_models()
+        self.ioloop.run_sync(databases.warm_up)
 
         server = tornado.httpserver.HTTPServer(application)
         server.bind(address=arguments.host, port=arguments.port)
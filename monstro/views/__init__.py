@@ -1,3 +1,7 @@
 from .authenticators import CookieAuthenticator, HeaderAuthenticator
-from .paginators import LimitOffsetPaginator, PageNumberPaginator
+from .paginators import (
+    KeysetPaginator,
+    LimitOffsetPaginator,
+    PageNumberPaginator
+)
 from .views import *  # pylint:disable=W0401
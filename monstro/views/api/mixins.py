@@ -22,6 +22,7 @@ class CreateAPIMixin(ModelAPIMixin):
 
             return self.send_error(400, details=e.error)
 
+        self.set_written()
         self.set_status(201)
         self.finish(await form.serialize())
 
@@ -40,6 +41,7 @@ class UpdateAPIMixin(ModelAPIMixin):
 
             return self.send_error(400, details=e.error)
 
+        self.set_written()
         self.finish(await form.serialize())
 
     async def patch(self, *args, **kwargs):
@@ -50,3 +52,4 @@ class DeleteAPIMixin(ModelAPIMixin):
 
     async def delete(self, *args, **kwargs):
         await (await self.get_object()).delete()
+        self.set_written()
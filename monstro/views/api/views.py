@@ -93,6 +93,7 @@ class ModelAPIView(ListResponseMixin,  # pylint:disable=R0901
                    APIView, metaclass=MetaModelAPIView):
 
     form_class = None
+    paginator_class = paginators.PageNumberPaginator
 
     @classmethod
     def get_url(cls):
@@ -116,7 +117,7 @@ class ModelAPIView(ListResponseMixin,  # pylint:disable=R0901
         await super().prepare()
 
     async def get_paginator(self):
-        return paginators.PageNumberPaginator(await self.get_form_class())
+        return self.paginator_class(await self.get_form_class())
 
     async def get_form_class(self):
         if not self.form_class:
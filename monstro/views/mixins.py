@@ -34,6 +34,13 @@ class ModelResponseMixin(object):
 class QuerysetResponseMixin(ModelResponseMixin):
 
     queryset = None
+    read_preference = None
+
+    async def get_read_preference(self):
+        if self.request.method not in ('GET', 'HEAD') or self.has_written():
+            return 'primary'
+
+        return self.read_preference
 
     async def get_queryset(self):
         model = await self.get_model()
@@ -43,7 +50,13 @@ class QuerysetResponseMixin(ModelResponseMixin):
             '"queryset" or an implementation of "get_queryset()"'
         )
 
-        return self.queryset or model.objects.filter()
+        queryset = self.queryset or model.objects.filter()
+        read_preference = await self.get_read_preference()
+
+        if read_preference:
+            queryset = queryset.read_from(read_preference)
+
+        return queryset
 
 
 class ListResponseMixin(QuerysetResponseMixin):
@@ -75,11 +88,13 @@ class ListResponseMixin(QuerysetResponseMixin):
         if fields and query:
             queryset = await self.filter_queryset(queryset, fields, query)
 
+        queryset = queryset.prefetch_related()
+
         if paginator:
             paginator.bind(**self.request.GET)
             return await paginator.paginate(queryset)
 
-        return queryset
+        return queryset.cache()
 
 
 class DetailResponseMixin(QuerysetResponseMixin):
@@ -1,16 +1,32 @@
+import base64
+import binascii
 import math
+import time
+
+from bson import json_util
+import tornado.gen
+import tornado.web
+
+from monstro.db import Raw
 
 
 DEFAULT_LIMIT = 50
+COUNT_CACHE_SIZE = 1000
 
 
 class Paginator(object):
 
     query_keys = {}
+    counts = {}
+
+    def __init__(self, form=None, query_keys=None, with_count=True,
+                 estimate_count=False, count_cache_ttl=None):
 
-    def __init__(self, form=None, query_keys=None):
         self.form = form
         self.query_keys = query_keys or self.query_keys
+        self.with_count = with_count
+        self.estimate_count = estimate_count
+        self.count_cache_ttl = count_cache_ttl
 
     def bind(self, **kwargs):
         raise NotImplementedError()
@@ -21,33 +37,98 @@ class Paginator(object):
     def get_limit(self):
         raise NotImplementedError()
 
+    async def get_count(self, queryset):
+        if self.count_cache_ttl is None:
+            return await self.count_queryset(queryset)
+
+        clone = queryset.clone()
+        await clone.validate()
+
+        key = (
+            clone.collection.full_name,
+            json_util.dumps(clone.query, sort_keys=True)
+        )
+        now = time.monotonic()
+
+        try:
+            number, expires = self.counts[key]
+        except KeyError:
+            pass
+        else:
+            if expires > now:
+                return number
+
+        number = await self.count_queryset(queryset)
+
+        if len(self.counts) >= COUNT_CACHE_SIZE:
+            for cached_key, (__, expires) in list(self.counts.items()):
+                if expires <= now:
+                    del self.counts[cached_key]
+
+            if len(self.counts) >= COUNT_CACHE_SIZE:
+                self.counts.clear()
+
+        self.counts[key] = (number, now + self.count_cache_ttl)
+
+        return number
+
+    async def count_queryset(self, queryset):
+        if self.estimate_count:
+            return await queryset.estimated_count()
+
+        return await queryset.count()
+
     async def paginate(self, queryset):
         offset = self.get_offset()
         limit = self.get_limit()
         size = limit - offset
 
-        number = await queryset.count()
-
         pages = {}
         pages['current'] = int(math.ceil(float(offset) / size)) + 1
-        pages['total'] = int(math.ceil(float(number) / size))
 
         if pages['current'] > 1:
             pages['previous'] = pages['current'] - 1
 
-        if pages['current'] < pages['total']:
-            pages['next'] = pages['current'] + 1
+        if self.with_count:
+            number, instances = await tornado.gen.multi([
+                self.get_count(queryset),
+                self.get_instances(queryset[offset:limit])
+            ])
 
-        items = []
+            pages['total'] = int(math.ceil(float(number) / size))
 
-        async for instance in queryset[offset:limit]:
-            if self.form:
-                instance = await self.form(instance=instance).serialize()
+            if pages['current'] < pages['total']:
+                pages['next'] = pages['current'] + 1
+        else:
+            instances = await self.get_instances(queryset[offset:limit + 1])
 
-            items.append(instance)
+            if len(instances) > size:
+                instances = instances[:size]
+                pages['next'] = pages['current'] + 1
+
+        items = await self.serialize(instances)
 
         return {'pages': pages, 'items': items}
 
+    async def get_instances(self, queryset):
+        instances = []
+
+        async for instance in queryset:
+            instances.append(instance)
+
+        return instances
+
+    async def serialize(self, instances):
+        if not self.form:
+            return instances
+
+        items = []
+
+        for instance in instances:
+            items.append(await self.form(instance=instance).serialize())
+
+        return items
+
 
 class PageNumberPaginator(Paginator):
 
@@ -83,3 +164,120 @@ class LimitOffsetPaginator(Paginator):
 
     def get_limit(self):
         return self.offset + self.limit
+
+
+class KeysetPaginator(Paginator):
+
+    query_keys = {
+        'cursor': 'cursor',
+        'count': 'count'
+    }
+
+    def __init__(self, form=None, query_keys=None, key='_id'):
+        super().__init__(form, query_keys)
+        self.key = key
+
+    def bind(self, **kwargs):
+        self.cursor = kwargs.get(self.query_keys['cursor']) or None
+        self.count = int(kwargs.get(self.query_keys['count'], DEFAULT_LIMIT))
+
+    def get_offset(self):
+        return 0
+
+    def get_limit(self):
+        return self.count
+
+    @staticmethod
+    def encode(direction, value, _id):
+        data = json_util.dumps([direction, value, _id]).encode('utf-8')
+        return base64.urlsafe_b64encode(data).decode('utf-8')
+
+    @staticmethod
+    def decode(cursor):
+        try:
+            data = base64.urlsafe_b64decode(cursor.encode('utf-8'))
+            direction, value, _id = json_util.loads(data.decode('utf-8'))
+        except (ValueError, TypeError, binascii.Error):
+            raise tornado.web.HTTPError(400, reason='Invalid cursor')
+
+        if direction not in ('next', 'previous'):
+            raise tornado.web.HTTPError(400, reason='Invalid cursor')
+
+        # Cursors come from the client, so only scalar values are accepted to
+        # keep query operators out of the keyset condition.
+        if isinstance(value, (dict, list)) or isinstance(_id, (dict, list)):
+            raise tornado.web.HTTPError(400, reason='Invalid cursor')
+
+        return direction, value, _id
+
+    async def get_cursor(self, queryset, direction, instance):
+        name = self.key.lstrip('-')
+        value = getattr(instance, name)
+
+        if name != '_id' and value is not None:
+            value = await queryset.model.Meta.fields[name].db_serialize(value)
+
+        return self.encode(direction, value, instance._id)
+
+    def filter_queryset(self, queryset, value, _id, descending):
+        name = self.key.lstrip('-')
+        operator = '$lt' if descending else '$gt'
+
+        if name == '_id':
+            condition = {'_id': {operator: _id}}
+        else:
+            condition = {'$or': [
+                {name: {operator: value}},
+                {name: value, '_id': {operator: _id}}
+            ]}
+
+        query = queryset.node.merge()
+
+        if isinstance(query, Raw):
+            return queryset.raw({'$and': [query.query, condition]})
+
+        conditions = list(query.get('$and', [])) + [condition]
+
+        return queryset.filter(**{'$and': conditions})
+
+    async def paginate(self, queryset):
+        name = self.key.lstrip('-')
+        direction, value, _id = 'next', None, None
+
+        if self.cursor:
+            direction, value, _id = self.decode(self.cursor)
+
+        backwards = direction == 'previous'
+        descending = self.key.startswith('-') != backwards
+        sorts = ['-{}'.format(name) if descending else name]
+
+        if name != '_id':
+            sorts.append('-_id' if descending else '_id')
+
+        queryset = queryset.clone(sorts=sorts)
+
+        if self.cursor:
+            queryset = self.filter_queryset(queryset, value, _id, descending)
+
+        instances = await self.get_instances(queryset[:self.count + 1])
+        more = len(instances) > self.count
+        instances = instances[:self.count]
+
+        if backwards:
+            instances.reverse()
+
+        pages = {}
+
+        if instances and (more if backwards else self.cursor):
+            pages['previous'] = await self.get_cursor(
+                queryset, 'previous', instances[0]
+            )
+
+        if instances and (self.cursor if backwards else more):
+            pages['next'] = await self.get_cursor(
+                queryset, 'next', instances[-1]
+            )
+
+        items = await self.serialize(instances)
+
+        return {'pages': pages, 'items': items}
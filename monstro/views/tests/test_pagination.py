@@ -1,8 +1,10 @@
+import tornado.web
+
 from monstro.db import Model, String
 import monstro.testing
 
 from monstro.views.paginators import (
-    Paginator, PageNumberPaginator, LimitOffsetPaginator
+    Paginator, PageNumberPaginator, LimitOffsetPaginator, KeysetPaginator
 )
 
 class User(Model):
@@ -84,6 +86,47 @@ class PageNumberPaginatorTest(monstro.testing.AsyncTestCase):
         self.assertEqual(1, len(data['items']))
         self.assertEqual('0', data['items'][0].value)
 
+    async def test_paginate__without_count(self):
+        pagination = PageNumberPaginator(with_count=False)
+        pagination.bind(page=2, count=2)
+
+        for i in range(5):
+            await self.TestModel.objects.create(value=str(i))
+
+        data = await pagination.paginate(self.TestModel.objects.filter())
+
+        self.assertEqual(2, data['pages']['current'])
+        self.assertEqual(3, data['pages']['next'])
+        self.assertNotIn('total', data['pages'])
+        self.assertEqual(['2', '3'], [item.value for item in data['items']])
+
+    async def test_paginate__estimate_count(self):
+        pagination = PageNumberPaginator(estimate_count=True)
+        pagination.bind(page=1, count=2)
+
+        for i in range(5):
+            await self.TestModel.objects.create(value=str(i))
+
+        data = await pagination.paginate(self.TestModel.objects.filter())
+
+        self.assertEqual(3, data['pages']['total'])
+
+    async def test_paginate__count_cache(self):
+        pagination = PageNumberPaginator(count_cache_ttl=60)
+        pagination.bind(page=1, count=1)
+
+        for i in range(2):
+            await self.TestModel.objects.create(value=str(i))
+
+        await pagination.paginate(self.TestModel.objects.filter(value='0'))
+        await self.TestModel.objects.create(value='0')
+
+        data = await pagination.paginate(
+            self.TestModel.objects.filter(value='0')
+        )
+
+        self.assertEqual(1, data['pages']['total'])
+
 
 class LimitOffsetPaginatorTest(monstro.testing.AsyncTestCase):
 
@@ -128,3 +171,78 @@ class LimitOffsetPaginatorTest(monstro.testing.AsyncTestCase):
         self.assertEqual(5, data['pages']['total'])
         self.assertEqual(1, len(data['items']))
         self.assertEqual('2', data['items'][0].value)
+
+
+class KeysetPaginatorTest(monstro.testing.AsyncTestCase):
+
+    class TestModel(Model):
+
+        value = String()
+
+        class Meta:
+            collection = 'test'
+
+    def test_bind(self):
+        pagination = KeysetPaginator()
+        pagination.bind(cursor='cursor', count=1)
+
+        self.assertEqual('cursor', pagination.cursor)
+        self.assertEqual(1, pagination.count)
+
+    def test_decode(self):
+        cursor = KeysetPaginator.encode('next', 'value', 'id')
+
+        self.assertEqual(
+            ('next', 'value', 'id'), KeysetPaginator.decode(cursor)
+        )
+
+    def test_decode__invalid(self):
+        with self.assertRaises(tornado.web.HTTPError):
+            KeysetPaginator.decode('invalid')
+
+    def test_decode__tampered(self):
+        for value, _id in (({'$ne': None}, 'id'), ('value', {'$gt': ''}),
+                           (['value'], 'id')):
+            cursor = KeysetPaginator.encode('next', value, _id)
+
+            with self.assertRaises(tornado.web.HTTPError):
+                KeysetPaginator.decode(cursor)
+
+    async def test_paginate(self):
+        for i in range(5):
+            await self.TestModel.objects.create(value=str(i))
+
+        pagination = KeysetPaginator(key='-value')
+        pagination.bind(count=2)
+
+        data = await pagination.paginate(self.TestModel.objects.filter())
+
+        self.assertEqual(['4', '3'], [item.value for item in data['items']])
+        self.assertNotIn('previous', data['pages'])
+
+        pagination.bind(cursor=data['pages']['next'], count=2)
+        data = await pagination.paginate(self.TestModel.objects.filter())
+
+        self.assertEqual(['2', '1'], [item.value for item in data['items']])
+        self.assertIn('next', data['pages'])
+
+        pagination.bind(cursor=data['pages']['previous'], count=2)
+        data = await pagination.paginate(self.TestModel.objects.filter())
+
+        self.assertEqual(['4', '3'], [item.value for item in data['items']])
+        self.assertNotIn('previous', data['pages'])
+        self.assertIn('next', data['pages'])
+
+    async def test_paginate__raw(self):
+        for i in range(5):
+            await self.TestModel.objects.create(value=str(i))
+
+        queryset = self.TestModel.objects.raw({'value': {'$ne': '0'}})
+        pagination = KeysetPaginator(key='value')
+        pagination.bind(count=2)
+
+        data = await pagination.paginate(queryset)
+        pagination.bind(cursor=data['pages']['next'], count=2)
+        data = await pagination.paginate(queryset)
+
+        self.assertEqual(['3', '4'], [item.value for item in data['items']])
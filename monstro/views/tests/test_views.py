@@ -147,6 +147,22 @@ class ListViewTest(monstro.testing.AsyncHTTPTestCase):
         self.assertEqual(200, response.code)
         self.assertEqual('test', response.body.decode('utf-8'))
 
+    def test_get_read_preference(self):
+        view = mock.Mock(read_preference='secondaryPreferred')
+        view.request.method = 'GET'
+        view.has_written.return_value = False
+
+        self.assertEqual(
+            'secondaryPreferred',
+            self.run_sync(ListView.get_read_preference, view)
+        )
+
+        view.has_written.return_value = True
+
+        self.assertEqual(
+            'primary', self.run_sync(ListView.get_read_preference, view)
+        )
+
 
 class DetailViewTest(monstro.testing.AsyncHTTPTestCase):
 
@@ -254,9 +270,22 @@ class CreateViewTest(monstro.testing.AsyncHTTPTestCase):
         )
 
         self.assertEqual(302, response.code)
+        self.assertNotIn('Set-Cookie', response.headers)
 
         self.run_sync(User.objects.get, **data)
 
+    def test_post__read_your_writes_window(self):
+        data = {'value': 'test'}
+
+        with mock.patch.object(self.TestView, 'read_your_writes_window', 5):
+            response = self.fetch(
+                '/', method='POST', body=urllib.parse.urlencode(data),
+                follow_redirects=False
+            )
+
+        self.assertEqual(302, response.code)
+        self.assertIn('monstro_written=1', response.headers['Set-Cookie'])
+
 
 class UpdateViewTest(monstro.testing.AsyncHTTPTestCase):
 
@@ -1,8 +1,10 @@
 import functools
+import time
 import urllib.parse
 
 import tornado.web
 
+from monstro.db import identity
 from monstro.forms import forms
 from monstro.views import mixins
 
@@ -23,6 +25,9 @@ __all__ = (
 class View(tornado.web.RequestHandler):
 
     authenticators = ()
+    written_cookie = 'monstro_written'
+    read_your_writes_window = None
+    use_identity_map = False
 
     @staticmethod
     def authenticated(argument=None):
@@ -59,12 +64,40 @@ class View(tornado.web.RequestHandler):
 
     def initialize(self):
         self.session = None
+        self.written = False
+        self.identity_map = None
+
+        if self.use_identity_map:
+            self.identity_map = identity.IdentityMap()
         self.request.GET = {}
         self.request.POST = {}
 
+    def _execute(self, transforms, *args, **kwargs):
+        if self.identity_map is None:
+            return super()._execute(transforms, *args, **kwargs)
+
+        with identity.scope(self.identity_map):
+            return super()._execute(transforms, *args, **kwargs)
+
+    def on_finish(self):
+        if self.identity_map is not None:
+            self.identity_map.clear()
+
     async def get_authenticators(self):
         return self.authenticators
 
+    def set_written(self):
+        self.written = True
+
+        if self.read_your_writes_window:
+            self.set_cookie(
+                self.written_cookie, '1',
+                expires=time.time() + self.read_your_writes_window
+            )
+
+    def has_written(self):
+        return self.written or bool(self.get_cookie(self.written_cookie))
+
     async def prepare(self):
         for key, value in self.request.query_arguments.items():
             self.request.GET[key] = value[0].decode('utf-8')
@@ -174,6 +207,7 @@ class CreateView(mixins.ModelResponseMixin, FormView):
 
     async def form_valid(self, form):
         await form.save()
+        self.set_written()
         return await super().form_valid(form)
 
 
@@ -191,4 +225,5 @@ class DeleteView(mixins.RedirectResponseMixin,
 
     async def delete(self, *args, **kwargs):
         await (await self.get_object()).delete()
+        self.set_written()
         return self.redirect(await self.get_redirect_url(), self.permanent)